@@ -13,12 +13,13 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from automation_menu.core.script_execution_manager import ScriptExecutionManager
+    from automation_menu.filehandling.exec_history_handler import ExecHistoryWriter
     from automation_menu.ui.main_window import AutomationMenuWindow
+    from ldap3.core.connection import Connection
 
 import queue
 
 from dataclasses import dataclass, field
-from ldap3.core.connection import Connection
 from logging import Logger
 
 from automation_menu.ui.history_manager import HistoryManager
@@ -32,6 +33,7 @@ from automation_menu.utils.script_manager import ScriptManager
 class ApplicationContext:
 
     startup_arguments: dict = field( default_factory = dict )
+    exec_history_writer: ExecHistoryWriter | None = None
     execution_manager: ScriptExecutionManager | None = None
     history_manager: HistoryManager | None = None
     input_manager: InputManager | None = None
@@ -42,7 +44,7 @@ class ApplicationContext:
     debug_logger: Logger | None = None
     ldap_connection: Connection | None = None
     main_window: AutomationMenuWindow | None = None
-    output_queue: queue.Queue = field( default_factory = queue.Queue )
+    output_queue: queue.SimpleQueue = field( default_factory = queue.SimpleQueue )
 
 
     def is_ldap_connected( self ) -> bool:
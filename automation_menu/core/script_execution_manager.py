@@ -20,7 +20,7 @@ import threading
 
 from contextlib import contextmanager
 from psutil import NoSuchProcess, Process
-from queue import Queue
+from queue import SimpleQueue
 from threading import Lock
 
 from automation_menu.core.script_runner import ScriptRunner
@@ -31,15 +31,15 @@ from automation_menu.ui.main_window import AutomationMenuWindow
 
 
 class ScriptExecutionManager:
-    def __init__( self, output_queue: Queue, app_state: ApplicationState ) -> None:
+    def __init__( self, output_queue: SimpleQueue, app_state: ApplicationState ) -> None:
         """ Provides a contextmanager for running a script
 
         Args:
-            output_queue (Queue): The queue gathering script output
+            output_queue (SimpleQueue): The queue gathering script output
             app_state (ApplicationState): General state of application
         """
 
-        self._output_queue: Queue = output_queue
+        self._output_queue: SimpleQueue = output_queue
         self.app_state: ApplicationState = app_state
         self.current_runner: ScriptRunner | None = None
         self._lock: Lock = threading.Lock()
@@ -277,8 +277,6 @@ class ScriptExecutionManager:
                 run_input = run_input,
             )
 
-            runner.current_runner.wait()
-
             exit_code: int = runner._exec_item.exit_code
             terminated: bool = runner._terminated
 
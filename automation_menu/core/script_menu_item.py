@@ -12,9 +12,8 @@ Created: 2025-09-25
 from __future__ import annotations
 from typing import TYPE_CHECKING, Callable
 
-from psutil import Process
-
 if TYPE_CHECKING:
+    from automation_menu.core.script_runner import ScriptRunner
     from automation_menu.ui.main_window import AutomationMenuWindow
 
 import logging
@@ -25,9 +24,12 @@ from tkinter.ttk import Frame, Label
 
 from automation_menu.models import ScriptInfo
 from automation_menu.models.enums import ScriptState
+from automation_menu.utils.localization import _
 
 
 class ScriptMenuItem:
+    __slots__ = ( 'script_menu', 'script_info', 'script_path', 'master_self', '_hide_menu', 'label_text', '_in_debug', '_style_normal', 'menu_button', 'entered_input' )
+
     def __init__ ( self, script_menu: Frame, script_info: ScriptInfo, main_object: AutomationMenuWindow, menu_hide_callback: Callable ) -> None:
         """ Object for representing a script in the menu
 
@@ -38,60 +40,49 @@ class ScriptMenuItem:
             menu_hide_callback (Callable): Function callback to hide menu view
         """
 
-        from automation_menu.utils.localization import _
-
         logging.basicConfig( level = logging.DEBUG )
 
         self.script_menu: Frame = script_menu
         self.script_info: ScriptInfo = script_info
-        self.script_path: str = script_info.get_attr( 'fullpath' )
+        self.script_path: str = script_info.fullpath
         self.master_self: AutomationMenuWindow = main_object
         self._hide_menu: Callable = menu_hide_callback
 
         self.master_self.app_state.running_automation = self
-        self.process: Process = None
-        self.label_text: str = ''
         self._in_debug: bool = False
 
-        if self.script_info.get_attr( 'synopsis' ):
-            self.label_text = self.script_info.get_attr( 'synopsis' )
-
-        else:
-            self.label_text = self.script_info.get_attr( 'filename' )
+        synopsis: str = script_info.scriptmeta.synopsis
+        description: str = script_info.scriptmeta.description
+        is_dev: bool = script_info.scriptmeta.state == ScriptState.DEV
+        is_app_test: bool = script_info.filename.startswith( 'AMTest_' )
 
+        self.label_text: str = synopsis or script_info.filename
         self._style_normal: str = 'ScriptNormal.TLabel'
-        self._style_hover: str = 'ScriptHover.TLabel'
 
-        if self.script_info.filename.startswith( 'AMTest_' ):
+        if is_app_test:
             self._style_normal = 'AppTestNormal.TLabel'
-            self._style_hover = 'AppTestHover.TLabel'
 
-        elif self.script_info.get_attr( 'state' ) == ScriptState.DEV:
+        elif is_dev:
             self.label_text = self.label_text + _( ' (Dev)' )
             self._style_normal = 'DevNormal.TLabel'
-            self._style_hover = 'DevHover.TLabel'
 
         self.menu_button: Label = Label( self.script_menu, text = self.label_text, style = self._style_normal, borderwidth = 1 )
         self.menu_button.bind( '<Button-1>' , lambda e: self._check_input_params() )
 
         # Add tooltip to this button
-        if self.script_info.get_attr( 'description' ):
+        if description:
             from alwaysontop_tooltip.alwaysontop_tooltip import AlwaysOnTopToolTip
 
-            desc: str = self.script_info.get_attr( 'description' )
-            dev: bool = False
-            app_test: bool = False
+            desc: str = description
 
-            if self.script_info.get_attr( 'state' ) == ScriptState.DEV:
+            if is_dev:
                 desc += f'\n\n{ _( 'In development, and should only be run by its developer.' ) }'
-                dev = True
 
-            if self.script_info.filename.startswith( 'AMTest_' ):
+            if is_app_test:
                 desc += f'\n\n{ _( 'Application test script, only used to test application functionality' ) }'
-                app_test = True
 
             tt: AlwaysOnTopToolTip = AlwaysOnTopToolTip( widget = self.menu_button, msg = desc, delay = 0 )
-            self.master_self.app_context.language_manager.add_translatable_widget( ( tt, self.script_info.get_attr( 'description' ), dev, app_test ) )
+            self.master_self.app_context.language_manager.add_translatable_widget( ( tt, description, is_dev, is_app_test ) )
 
 
     def _check_input_params( self ) -> None:
@@ -99,7 +90,7 @@ class ScriptMenuItem:
 
         self._hide_menu()
 
-        if len( self.script_info.scriptmeta.script_input_parameters ) > 0:
+        if self.script_info.scriptmeta.has_input_parameters():
             self.master_self.app_context.input_manager.show_for_script( script_info = self.script_info, submit_input_callback = self.run_script )
 
         else:
@@ -109,20 +100,23 @@ class ScriptMenuItem:
     def continue_breakpoint( self ) -> None:
         """ Continue execution of the script after hitting a breakpoint """
 
-        self.process.stdin.write( 'c\n' )
-        self.process.stdin.flush()
-        self.master_self.btnContinueBreakpoint.after( 0, self.master_self.enable_breakpoint_button() )
+        runner: ScriptRunner | None = self.master_self.app_context.execution_manager.current_runner
+
+        if runner:
+            runner.write_stdin( text = 'c\n' )
+
         self._in_debug = False
 
 
     def on_enter( self, event: Event ) -> None:
         """ Change label background on mouse enter
+        The hover background is mapped to the 'active' state in the label style
 
         Args:
             event (Event): Event that triggered handler
         """
 
-        event.widget.configure( style = self._style_hover )
+        event.widget.state( [ 'active' ] )
 
 
     def on_leave( self, event: Event ) -> None:
@@ -132,14 +126,12 @@ class ScriptMenuItem:
             event (Event): Event that triggered handler
         """
 
-        event.widget.configure( style = self._style_normal )
+        event.widget.state( [ '!active' ] )
 
 
     def run_script( self ) -> None:
         """ Initiate script execution """
 
-        from automation_menu.utils.localization import _
-
         def script_process_wrapper() -> None:
             """ Wrapper to execute script from separate thread """
 
@@ -15,13 +15,14 @@ if TYPE_CHECKING:
     from automation_menu.core.script_execution_manager import ScriptExecutionManager
 
 import asyncio
+import codecs
+import os
 import psutil
+import re
 import subprocess
 import sys
-import threading
 
-from queue import Queue
-from threading import Event
+from queue import SimpleQueue
 from tkinter import Tk
 
 from automation_menu.api.script_api import MESSAGE_END, MESSAGE_START
@@ -30,30 +31,64 @@ from automation_menu.models.enums import OutputStyleTags, SysInstructions
 from automation_menu.models.exechistory import ExecHistory
 from automation_menu.models.scriptinfo import ScriptInfo
 from automation_menu.utils.email_handler import report_script_error
+from automation_menu.utils.localization import _
 from automation_menu.utils.screenshot import take_screenshot
 
 
+# Number of bytes requested from a process output stream per read
+STREAM_READ_SIZE: int = 64 * 1024
+
+# Debugger messages announcing that a breakpoint was hit, capturing the line number
+# PowerShell is matched on the debuggers own message, not the 'At <file>:<line>' position line also printed for errors
+PY_BREAKPOINT_RE: re.Pattern = re.compile( r'^.*\((.*)\)<module>\(\)', re.IGNORECASE )
+PS_BREAKPOINT_RE: re.Pattern = re.compile( r"^Hit Line breakpoint on '.*:(\d+)'" )
+
+# Per script file extension; arguments preceding the script path, and the breakpoint message pattern
+SCRIPT_LAUNCHERS: dict[ str, list[ str ] ] = {
+    '.py': [ sys.executable ],
+    '.ps1': [ 'powershell.exe', '-NoProfile', '-File' ]
+}
+BREAKPOINT_PATTERNS: dict[ str, re.Pattern ] = {
+    '.py': PY_BREAKPOINT_RE,
+    '.ps1': PS_BREAKPOINT_RE
+}
+
+
+def _normalize_newlines( text: str ) -> str:
+    """ Convert '\r\n' and lone '\r' line endings to '\n', as universal newlines mode does
+
+    Args:
+        text (str): Text to convert
+
+    Returns:
+        (str): Text with '\n' line endings only
+    """
+
+    return text.replace( '\r\n', '\n' ).replace( '\r', '\n' )
+
+
 class ScriptRunner:
-    def __init__( self, output_queue: Queue, app_state: ApplicationState, exec_manager: ScriptExecutionManager ) -> None:
+    def __init__( self, output_queue: SimpleQueue, app_state: ApplicationState, exec_manager: ScriptExecutionManager ) -> None:
         """" A script runner, managing bootup, process output and termination
 
         Args:
-            output_queue (Queue): Queue for gathering output data
+            output_queue (SimpleQueue): Queue for gathering output data
             app_state (ApplicationState): General state of application
             exec_manager (ScriptExecutionManager): Running manager to handle context for script process
         """
 
-        self._output_queue: Queue = output_queue
+        self._output_queue: SimpleQueue = output_queue
         self.app_state: ApplicationState = app_state
         self.script_execution_manager: ScriptExecutionManager = exec_manager
         self.main_window = None
 
-        self.current_process: subprocess.Popen | None = None
+        self.current_process: asyncio.subprocess.Process | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._tasks: list[ asyncio.Task ] = []
         self._script_info: ScriptInfo = None
         self._in_breakpoint: bool = False
+        self._breakpoint_re: re.Pattern | None = None
         self._terminated: bool = False
-        self._process_started: Event = threading.Event()
 
 
     def _collect_error_info( self, error: str ) -> None:
@@ -75,8 +110,6 @@ class ScriptRunner:
             if self.app_state.settings.include_ss_in_error_mail:
                 ss_path = take_screenshot( root_window = self.main_window, script_info = self._script_info, file_name_prefix = self.app_state.secrets.get( 'error_ss_prefix' ) )
 
-            from automation_menu.utils.localization import _
-
             try:
                 report_script_error( app_state = self.app_state, error_msg = error, script_info = self._script_info, screenshot = ss_path )
 
@@ -94,148 +127,153 @@ class ScriptRunner:
                 } )
 
 
-    def _create_process( self ) -> None:
-        """ Create and start a process to execute script """
+    async def _create_process( self, extension: str ) -> asyncio.subprocess.Process:
+        """ Create and start a process to execute script
 
-        from automation_menu.utils.localization import _
-
-        exec_string: str = ''
+        Args:
+            extension (str): Lowercased file extension of the script
 
-        if self._script_info.get_attr( 'filename' ).endswith( '.py' ):
-            exec_string = sys.executable
+        Returns:
+            (asyncio.subprocess.Process): The started script process
+        """
 
-        elif self._script_info.get_attr( 'filename' ).endswith( '.ps1' ):
-            exec_string = 'powershell.exe'
+        launch_args: list[ str ] = SCRIPT_LAUNCHERS.get( extension, [] )
 
-        return subprocess.Popen(
-            args = [ exec_string, str( self._script_info.get_attr( 'fullpath' ) ) ] + self.run_input,
+        return await asyncio.create_subprocess_exec(
+            *launch_args, str( self._script_info.fullpath ), *self.run_input,
             stdout = asyncio.subprocess.PIPE,
             stderr = asyncio.subprocess.PIPE,
             stdin = asyncio.subprocess.PIPE,
-            text = True,
-            encoding = 'utf-8',
-            errors = 'replace'
+            creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == 'win32' else 0
         )
 
 
-    def _is_breakpoint_line( self, line: str ) -> bool:
-        """ Verify if a line from the output, corresponds with a breakpoint has occured in the running script
+    async def _execute( self ) -> None:
+        """ Start the script process, pump both output streams and wait for it to finish """
 
-        Args:
-            line (str): Output line to check
+        self._loop = asyncio.get_running_loop()
+        extension: str = os.path.splitext( self._script_info.filename )[ 1 ].lower()
 
-        Returns:
-            (bool): True if line corresponds with breakpoint info message
-        """
+        # Only look for debugger messages when the script can stop at a breakpoint
+        if extension != '.py' or self._script_info.using_breakpoint:
+            self._breakpoint_re = BREAKPOINT_PATTERNS.get( extension )
 
-        import re
+        self.current_process = await self._create_process( extension = extension )
 
-        return re.search( r'^.*\((.*)\)<module>\(\)', line.lower() ) or re.search( 'At .*:{l}', line )
+        await asyncio.gather(
+            self._pump( stream = self.current_process.stdout, tag = OutputStyleTags.INFO, detect_breakpoints = self._breakpoint_re is not None ),
+            self._pump( stream = self.current_process.stderr, tag = OutputStyleTags.ERROR )
+        )
 
+        return_code: int = await self.current_process.wait()
+        self._report_completion( return_code = return_code )
 
-    def _read_monitor_completion( self ) -> None:
-        """ Wait for script process to finish and inform when """
 
-        from automation_menu.utils.localization import _
+    def _is_breakpoint_line( self, line: str ) -> str | None:
+        """ Verify if a line from the output, corresponds with a breakpoint has occured in the running script
 
-        self._process_started.wait()
-        p: subprocess.Popen = self.current_process
+        Args:
+            line (str): Output line to check
 
-        if not p:
-            return
+        Returns:
+            (str | None): Line number of the breakpoint, or None if line is not a breakpoint info message
+        """
 
-        return_code: int = p.wait()
-        self._exec_item.set_exit_code( exit_code = return_code )
+        match: re.Match | None = self._breakpoint_re.search( line )
 
-        if self._terminated:
-            self._exec_item.set_terminated()
-            self._output_queue.put( {
-                'line': _( 'Script terminated' ),
-                'tag': OutputStyleTags.SYSINFO,
-                'finished': True,
-                'exec_item': self._exec_item
-            } )
+        if match:
 
-        elif return_code == 0:
-            self._output_queue.put( {
-                'line': _( 'Script completed successfully' ),
-                'tag': OutputStyleTags.SUCCESS,
-                'finished': True,
-                'exec_item': self._exec_item
-            } )
+            return match.group( 1 )
 
-        else:
-            self._output_queue.put( {
-                    'line':_( 'Script failed with exit code {err}' ).format( err = return_code ),
-                    'tag': OutputStyleTags.SYSERROR,
-                    'finished': True,
-                    'exec_item': self._exec_item
-            } )
+        return None
 
-        self.api_callbacks[ 'update_progress' ]( 0 )
-        self.api_callbacks[ 'hide_progress' ]()
-        self.api_callbacks[ 'clear_status' ]()
-        self.script_execution_manager._paused = False
 
+    def _kill_process( self ) -> None:
+        """ Kill the script process, must be called from the runner event loop """
 
-    def _read_stderr( self ) -> None:
-        """ Monitor standard error output from running process """
+        try:
+            self.current_process.kill()
 
-        from automation_menu.utils.localization import _
+        except ProcessLookupError:
+            pass
 
-        self._process_started.wait()
 
-        p: subprocess.Popen = self.current_process
+    async def _pump( self, stream: asyncio.StreamReader, tag: OutputStyleTags, detect_breakpoints: bool = False ) -> None:
+        """ Read a process output stream in chunks and pass each complete line on to the output queue
 
-        if not p or not p.stderr:
+        Args:
+            stream (asyncio.StreamReader): Output stream of the running process
+            tag (OutputStyleTags): Style tag for lines read from the stream
+            detect_breakpoints (bool): Should lines be checked for breakpoint info messages
+        """
+
+        if not stream:
 
             return
 
+        decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder( 'utf-8' )( errors = 'replace' )
+        residual: str = ''
+
         while True:
             try:
-                line: str = self.current_process.stderr.readline()
+                chunk: bytes = await stream.read( STREAM_READ_SIZE )
 
-            except:
+            except Exception:
                 break
 
-            if not line:
+            if not chunk:
                 break
 
-            line_str: str = line.decode() if isinstance( line, bytes ) else line
+            text: str = residual + decoder.decode( chunk )
+            held: str = ''
 
-            self._output_queue.put( {
-                'line': line_str.rstrip(),
-                'tag': OutputStyleTags.ERROR,
-                'exec_item': self._exec_item
-            } )
+            # A trailing '\r' can be the first half of a '\r\n' split between chunks
+            if text.endswith( '\r' ):
+                text, held = text[ :-1 ], '\r'
 
+            *lines, residual = _normalize_newlines( text ).split( '\n' )
+            residual += held
 
-    def _read_stdout( self ) -> None:
-        """ Monitor standard output from running process """
+            self._put_output_lines( lines = lines, tag = tag, detect_breakpoints = detect_breakpoints )
 
-        from automation_menu.utils.localization import _
+        residual = _normalize_newlines( residual + decoder.decode( b'', final = True ) )
+        self._put_output_lines( lines = [ line for line in residual.split( '\n' ) if line ], tag = tag, detect_breakpoints = detect_breakpoints )
 
-        self._process_started.wait()
-        p: subprocess.Popen = self.current_process
 
-        if not p or not p.stdout:
+    def _put_line_batch( self, lines: list[ str ], tag: OutputStyleTags ) -> None:
+        """ Put gathered lines of script output on the output queue as one item
 
-            return
+        Args:
+            lines (list[ str ]): Lines of output, nothing is put if empty
+            tag (OutputStyleTags): Style tag for the lines
+        """
 
-        while True:
-            try:
-                line: str = self.current_process.stdout.readline()
+        if lines:
+            self._output_queue.put( {
+                'lines': lines,
+                'tag': tag,
+                'exec_item': self._exec_item
+            } )
 
-            except:
-                break
 
-            if not line:
-                break
+    def _put_output_lines( self, lines: list[ str ], tag: OutputStyleTags, detect_breakpoints: bool ) -> None:
+        """ Put lines of script output on the output queue
+        Ordinary lines are gathered into one item, API messages and breakpoint info are put as separate items, keeping the order of the lines
+
+        Args:
+            lines (list[ str ]): Lines of output
+            tag (OutputStyleTags): Style tag for the lines
+            detect_breakpoints (bool): Should the lines be checked for breakpoint info messages
+        """
 
-            line_str: str = line.decode() if isinstance( line, bytes ) else line
-            line_nr: int = self._is_breakpoint_line( line_str )
+        batch: list[ str ] = []
+
+        for line in lines:
+            line_nr: str | None = self._is_breakpoint_line( line ) if detect_breakpoints else None
 
             if line_nr:
+                self._put_line_batch( lines = batch, tag = tag )
+                batch = []
                 self._in_breakpoint = True
                 self._output_queue.put( {
                     'line': _( 'A breakpoint occured in the script at row {line_nr}. Click \'Continue\' to reactivate script.' ).format( line_nr = line_nr ),
@@ -243,13 +281,76 @@ class ScriptRunner:
                     'breakpoint': True,
                     'exec_item': self._exec_item
                 } )
-            else:
+
+            elif MESSAGE_START in line:
+                # API messages are parsed from single line items
+                self._put_line_batch( lines = batch, tag = tag )
+                batch = []
                 self._output_queue.put( {
-                    'line': line_str.rstrip(),
-                    'tag': OutputStyleTags.INFO,
+                    'line': line.rstrip(),
+                    'tag': tag,
                     'exec_item': self._exec_item
                 } )
 
+            else:
+                batch.append( line.rstrip() )
+
+        self._put_line_batch( lines = batch, tag = tag )
+
+
+    def _report_completion( self, return_code: int ) -> None:
+        """ Inform about how the script process finished
+
+        Args:
+            return_code (int): Exit code of the finished process
+        """
+
+        self._exec_item.set_exit_code( exit_code = return_code )
+
+        if self._terminated:
+            self._exec_item.set_terminated()
+            self._output_queue.put( {
+                'line': _( 'Script terminated' ),
+                'tag': OutputStyleTags.SYSINFO,
+                'finished': True,
+                'exec_item': self._exec_item
+            } )
+
+        elif return_code == 0:
+            self._output_queue.put( {
+                'line': _( 'Script completed successfully' ),
+                'tag': OutputStyleTags.SUCCESS,
+                'finished': True,
+                'exec_item': self._exec_item
+            } )
+
+        else:
+            self._output_queue.put( {
+                    'line':_( 'Script failed with exit code {err}' ).format( err = return_code ),
+                    'tag': OutputStyleTags.SYSERROR,
+                    'finished': True,
+                    'exec_item': self._exec_item
+            } )
+
+        self.api_callbacks[ 'update_progress' ]( 0 )
+        self.api_callbacks[ 'hide_progress' ]()
+        self.api_callbacks[ 'clear_status' ]()
+        self.script_execution_manager._paused = False
+
+
+    def _write_stdin( self, text: str ) -> None:
+        """ Write text to the script stdin, must be called from the runner event loop
+
+        Args:
+            text (str): Text to write
+        """
+
+        try:
+            self.current_process.stdin.write( text.encode( 'utf-8' ) )
+
+        except:
+            pass
+
 
     def run_script( self,
                     script_info: ScriptInfo,
@@ -272,8 +373,6 @@ class ScriptRunner:
             run_input (list[ str ]): List of input arguments to send the script
         """
 
-        from automation_menu.utils.localization import _
-
         self._script_info = script_info
         self.main_window = main_window
         self.api_callbacks = api_callbacks
@@ -283,7 +382,7 @@ class ScriptRunner:
 
         try:
             self._exec_item = ExecHistory( script_info = self._script_info )
-            line: str = _( 'Starting \'{file}\'' ).format( file = self._script_info.get_attr( 'synopsis' ) )
+            line: str = _( 'Starting \'{file}\'' ).format( file = self._script_info.scriptmeta.synopsis )
             self._output_queue.put( {
                 'line': line,
                 'tag': OutputStyleTags.SYSINFO,
@@ -293,14 +392,7 @@ class ScriptRunner:
             enable_stop_button_callback()
             enable_pause_button_callback()
 
-            threading.Thread( target = self._read_stdout, daemon = True, name = f'{ self._script_info.filename }_stdout' ).start()
-            threading.Thread( target = self._read_stderr, daemon = True, name = f'{ self._script_info.filename }_stderr' ).start()
-            threading.Thread( target = self._read_monitor_completion, daemon = True, name = f'{ self._script_info.filename }_stdmonitor' ).start()
-
-            self.current_process: subprocess.Popen = self._create_process()
-            self._process_started.set()
-
-            self.current_process.wait()
+            asyncio.run( self._execute() )
 
         except subprocess.SubprocessError as e:
             error_line = _( 'Subprocess error {error}' ).format( error = e )
@@ -322,24 +414,17 @@ class ScriptRunner:
             response (str): String formated response to send
         """
 
-        msg: str = f'{ MESSAGE_START }{ response }{ MESSAGE_END }\n'
-
-        try:
-            self.current_process.stdin.write( msg )
-            self.current_process.stdin.flush()
-
-        except:
-            pass
+        self.write_stdin( text = f'{ MESSAGE_START }{ response }{ MESSAGE_END }\n' )
 
 
     def terminate( self ) -> None:
         """ Force the running process to terminate """
 
-        def _process_reaper( p: subprocess.Popen ) -> None:
+        def _process_reaper( p: asyncio.subprocess.Process ) -> None:
             """ Find and end any child process
 
             Args:
-                p (subprocess.Popen): Process referense to kill
+                p (asyncio.subprocess.Process): Process referense to kill
             """
 
             children: list[ psutil.Process ] = psutil.Process( p.pid ).children( recursive = True )
@@ -347,11 +432,16 @@ class ScriptRunner:
             for child in children:
                 child.kill()
 
-            p.kill()
+            # The process belongs to the runner event loop, asyncio transports are not thread-safe
+            if self._loop and not self._loop.is_closed():
+                try:
+                    self._loop.call_soon_threadsafe( self._kill_process )
+
+                except RuntimeError:
+                    pass
 
 
         if self.current_process:
-            from automation_menu.utils.localization import _
             line: str = ''
 
             try:
@@ -377,3 +467,21 @@ class ScriptRunner:
                     'tag': OutputStyleTags.SYSERROR,
                     'exec_item': self._exec_item
                 } )
+
+
+    def write_stdin( self, text: str ) -> None:
+        """ Hand text over to the runner event loop, to be written to the script stdin
+
+        Args:
+            text (str): Text to write
+        """
+
+        if not self._loop or self._loop.is_closed():
+
+            return
+
+        try:
+            self._loop.call_soon_threadsafe( self._write_stdin, text )
+
+        except RuntimeError:
+            pass
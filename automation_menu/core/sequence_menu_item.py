@@ -23,6 +23,8 @@ from tkinter.ttk import Frame, Label
 
 
 class SequenceMenuItem:
+    __slots__ = ( '_sequence_menu', '_sequence', '_main_object', '_hide_menu', 'menu_button' )
+
     def __init__ ( self, sequence_menu: Frame, sequence: Sequence, main_object: AutomationMenuWindow, menu_hide_callback: Callable ) -> None:
         """ Object for representing a sequence in the menu
 
@@ -63,12 +65,13 @@ class SequenceMenuItem:
 
     def on_enter( self, event: Event ) -> None:
         """ Change label background on mouse enter
+        The hover background is mapped to the 'active' state in the label style
 
         Args:
             event (Event): Event triggering the function
         """
 
-        event.widget.configure( style = 'ScriptHover.TLabel' )
+        event.widget.state( [ 'active' ] )
 
 
     def on_leave( self, event: Event ) -> None:
@@ -78,4 +81,4 @@ class SequenceMenuItem:
             event (Event): Event triggering the function
         """
 
-        event.widget.configure( style = 'ScriptNormal.TLabel' )
+        event.widget.state( [ '!active' ] )
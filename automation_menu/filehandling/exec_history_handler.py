@@ -13,53 +13,127 @@ from logging import Logger
 import os
 
 from datetime import datetime
+from io import TextIOWrapper
 from pathlib import Path, WindowsPath
+from typing import Callable
 
 
-def write_exec_history( exec_items: list[ dict ], root_dir: WindowsPath, logger: Logger ) -> None:
-    """ Write settings to JSON file
-    
+# Number of written entries after which the history file is flushed to disk
+FLUSH_AFTER_ENTRIES: int = 16
+
+# User running the application, recorded with each log entry
+_USERNAME: str = os.environ.get( 'USERNAME', 'DefaultUser' )
+
+# Encoder for log entries, non-ASCII text is written as is since the file is UTF-8
+_encode_log_entry: Callable[ [ dict ], str ] = json.JSONEncoder( ensure_ascii = False ).encode
+
+
+def _get_log_folder( root_dir: WindowsPath, year: int, month: int ) -> Path:
+    """ Get the log folder for given month, creating it if it does not exist
+
     Args:
-        exec_items (list[ dict ]): String representation of execution history
-        root_dir (WindowsPath): Path to file to write
-        logger (Logger): General purpose logging object
+        root_dir (WindowsPath): Application root directory
+        year (int): Year of the log folder
+        month (int): Month of the log folder
 
-    Raises:
-        FileNotFoundError when the path is not valid
+    Returns:
+        (Path): Path of the log folder
     """
 
-    from automation_menu.utils.localization import _
+    folder_path: Path = root_dir / 'Log' / str( year ) / str( month )
+    folder_path.mkdir( parents = True, exist_ok = True )
+
+    return folder_path
+
+
+class ExecHistoryWriter:
+    def __init__( self, root_dir: WindowsPath, logger: Logger ) -> None:
+        """ Writer for execution history, keeping the history file open between writes
+        A new file is opened when the month changes
+
+        Args:
+            root_dir (WindowsPath): Application root directory, under which the log folder is kept
+            logger (Logger): General purpose logging object
+        """
+
+        self._root_dir: WindowsPath = root_dir
+        self._logger: Logger = logger
+        self._file: TextIOWrapper | None = None
+        self._current_month: tuple[ int, int ] | None = None
+        self._unflushed_entries: int = 0
+
+
+    def _open_file( self, now: datetime ) -> None:
+        """ Open the history file for the month of given time
+
+        Args:
+            now (datetime): Time to get the month from
+
+        Raises:
+            FileNotFoundError when the path is not valid
+        """
+
+        from automation_menu.utils.localization import _
+
+        self.close()
+
+        file_path: Path = _get_log_folder( root_dir = self._root_dir, year = now.year, month = now.month ) / 'ExecHistory.jsonl'
+
+        try:
+            self._file = open( file_path, mode = 'a', encoding = 'utf-8', buffering = 1 << 16 )
+
+        except FileNotFoundError as e:
+            raise FileNotFoundError( _( 'Writing execution history error; file not found: {file_path}' ).format( file_path = file_path ) ) from e
+
+        self._current_month = ( now.year, now.month )
+
+
+    def close( self ) -> None:
+        """ Flush and close the history file """
+
+        if self._file:
+            self._file.close()
+            self._file = None
+            self._unflushed_entries = 0
+
+
+    def write( self, exec_items: list[ dict ] ) -> None:
+        """ Write execution history items to the history file
+
+        Args:
+            exec_items (list[ dict ]): Dict representations of execution history
+        """
+
+        from automation_menu.utils.localization import _
 
-    folder_path: Path = Path.joinpath( root_dir, 'Log', str( datetime.now().year ) , str( datetime.now().month ) )
+        now: datetime = datetime.now()
 
-    if not folder_path.exists():
-        folder_path.mkdir( parents = True, exist_ok = True )
+        if self._file is None or self._current_month != ( now.year, now.month ):
+            self._open_file( now = now )
 
-    file_path: Path = Path.joinpath( folder_path, 'ExecHistory.jsonl' )
+        timestamp: str = now.isoformat()
+        log_lines: list[ str ] = []
 
-    if not file_path.exists():
-        with open( file_path, 'w' ) as f:
-            pass
+        for item in exec_items:
+            log_entry: dict[ str, str | dict ] = {
+                'timestamp': timestamp,
+                'user': _USERNAME,
+                'execution': item
+            }
 
-    try:
-        with open( file_path, mode = 'a', encoding = 'utf-8' ) as f:
-            for item in exec_items:
-                log_entry: dict[ str, str | dict ] = {
-                    'timestamp': datetime.now().isoformat(),
-                    'user': os.getenv( key = 'USERNAME', default = 'DefaultUser' ),
-                    'execution': item
-                }
+            try:
+                log_lines.append( _encode_log_entry( log_entry ) )
 
-                try:
-                    f.write( json.dumps( log_entry ) )
+            except:
+                self._logger.warning( _( 'Failed to serialize history item {h} ' ).format( h = item ) )
 
-                except:
-                    logger.warning( _( 'Failed to serialize history item {h} ' ).format( h = item ) )
+        if not log_lines:
 
-                f.write( '\n')
+            return
 
-    except FileNotFoundError as e:
-        raise FileNotFoundError( _( 'Writing execution history error; file not found: {file_path}' ).format( file_path = file_path ) ) from e
+        self._file.write( '\n'.join( log_lines ) + '\n' )
+        self._unflushed_entries += len( log_lines )
 
-    except Exception as e:
-        raise e
+        if self._unflushed_entries >= FLUSH_AFTER_ENTRIES:
+            self._file.flush()
+            self._unflushed_entries = 0
@@ -18,18 +18,32 @@ if TYPE_CHECKING:
 import os
 import re
 
-from operator import attrgetter
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import WindowsPath
-from queue import Queue
+from queue import SimpleQueue
 
 from automation_menu.models import ScriptInfo, User
 from automation_menu.models.custom_exceptions import ScriptInfoError
 from automation_menu.models.enums import ApplicationRunState, OutputStyleTags, ScriptState
 from automation_menu.models.scriptmetadata import ScriptMetadata
 from automation_menu.utils.docstring_parser import extract_script_metadata
+from automation_menu.utils.localization import _
 from automation_menu.utils.scriptinfo_block_parser import scriptinfo_block_parser
 
 
+# Script files to list, excluding package init and general test files
+SCRIPT_FILENAME_RE: re.Pattern = re.compile( r'^(?!__init__|GeneralTestFile).*\.(py|ps1)$' )
+
+# Upper limit of threads reading script files concurrently
+DISCOVERY_MAX_WORKERS: int = 16
+
+# Keys the metadata parsers report warnings under
+PARSE_WARNING_KEYS: frozenset[ str ] = frozenset( ( 'keys', 'values', 'other' ) )
+
+# Parsed scripts from earlier listings, keyed by full path, with the modification time they were parsed at
+_SCRIPT_CACHE: dict[ str, tuple[ int, ScriptInfo, dict ] ] = {}
+
+
 def _approve_listing( script_info: ScriptInfo, app_run_state: ApplicationRunState, current_user: User ) -> int:
     """ Verify that the script is valid to be listed in the menu
 
@@ -45,42 +59,29 @@ def _approve_listing( script_info: ScriptInfo, app_run_state: ApplicationRunStat
     meta: ScriptMetadata = script_info.scriptmeta
 
     is_author: bool = script_info.is_author( current_user )
+    is_dev_run: bool = app_run_state == ApplicationRunState.DEV
 
     if meta.requires_permission_check():
 
-        required_ad_groups: list[ str ] = script_info.get_attr( 'required_ad_groups' ) or []
-        allowed_users: list[ str ] = script_info.get_attr( 'allowed_users' ) or []
-
-        # Is user in at least one required AD group
-        in_required_group: bool = (
-            len( required_ad_groups ) == 0
-            or any(
-                current_user.is_member_of( group_to_check = g )
-                for g in required_ad_groups
-            )
-        )
-
-        # Is user explicitly allowed
-        in_allowed_users: bool = (
-            ( len( allowed_users ) == 0 ) or
-            ( current_user.UserId in allowed_users )
-        )
+        required_ad_groups: frozenset[ str ] = meta.required_ad_groups
+        allowed_users: frozenset[ str ] = meta.allowed_users
 
         # Author or application run state 'dev' ignore script state
-        state: ScriptState = meta.state
         state_ok: bool = (
-            ( state in ( ScriptState.TEST, ScriptState.PROD ) ) or
-            ( app_run_state == ApplicationRunState.DEV ) or
+            ( meta.state in ( ScriptState.TEST, ScriptState.PROD ) ) or
+            is_dev_run or
             is_author
         )
 
+        # A restriction that is not specified does not grant access,
+        # group membership and allowed users are only checked if not already permitted
         valid_script_permission: bool = (
             state_ok and
             (
                 is_author or
-                ( app_run_state == ApplicationRunState.DEV ) or
-                ( in_required_group ) or
-                in_allowed_users
+                is_dev_run or
+                ( bool( required_ad_groups ) and current_user.member_of_any( groups = required_ad_groups ) ) or
+                ( bool( allowed_users ) and current_user.UserId in allowed_users )
             )
         )
 
@@ -91,9 +92,7 @@ def _approve_listing( script_info: ScriptInfo, app_run_state: ApplicationRunStat
 
         return 2
 
-    script_info: ScriptInfo = _check_breakpoints( script_info )
-
-    if script_info.get_attr( 'using_breakpoint' ):
+    if script_info.using_breakpoint:
         # If script has active breakpoints, only the author may see it
         if is_author:
 
@@ -106,48 +105,62 @@ def _approve_listing( script_info: ScriptInfo, app_run_state: ApplicationRunStat
     return 0
 
 
-def _check_breakpoints( script_info: ScriptInfo ) -> ScriptInfo:
+def _check_breakpoints( script_info: ScriptInfo, text: str ) -> ScriptInfo:
     """ Check for uncommented breakpoints
 
     Args:
         script_info (ScriptInfo): Script info gathered from the scripts info block
+        text (str): Content of the script file
 
     Returns:
         script_info (ScriptInfo): ScriptInfo with possible 'UsingBreakpoint'
     """
 
-    with open( script_info.get_attr( 'fullpath' ), 'r', encoding = 'utf-8' ) as f:
-        lines: list[ str ] = f.readlines()
+    # Most scripts have no breakpoint at all, skip splitting them into lines
+    if 'breakpoint()' not in text:
+
+        return script_info
 
-    for line in lines:
+    for line in text.splitlines():
         stripped_line: str = line.lstrip()
 
-        if stripped_line.startswith( 'breakpoint()' ) or ' breakpoint()' in stripped_line:
+        if stripped_line.startswith( '#' ):
+            continue
 
-            if not stripped_line.startswith( '#' ):
-                script_info.add_attr( 'using_breakpoint', True )
-                break
+        if stripped_line.startswith( 'breakpoint()' ) or ' breakpoint()' in stripped_line:
+            script_info.using_breakpoint = True
+            break
 
     return script_info
 
 
-def _read_scriptfile( file: str, directory: str, current_user: User ) -> ScriptInfo:
+def _entry_sort_key( entry: os.DirEntry ) -> str:
+    """ Sort key for directory entries, case insensitive file name
+
+    Args:
+        entry (os.DirEntry): Directory entry of the script file
+
+    Returns:
+        (str): Lower case file name
+    """
+
+    return entry.name.lower()
+
+
+def _read_scriptfile( file: str, path: str, current_user: User ) -> ScriptInfo:
     """ Call for script information gathering of specified script file
 
     Args:
         file (str): File name of the script
-        directory (str): Directory path containing the script
+        path (str): Full path of the script
         current_user (User): AD object for current user
     """
 
-    from automation_menu.utils.localization import _
-
-    path: str = os.path.join( directory, file )
     script_info: ScriptInfo = ScriptInfo( filename = file, fullpath = path )
 
     try:
         with open( path, 'r', encoding = 'utf-8' ) as f:
-            f.read( 1 )
+            text: str = f.read()
 
     except FileNotFoundError as e:
         raise FileNotFoundError( _( 'File not found' ) )
@@ -155,11 +168,11 @@ def _read_scriptfile( file: str, directory: str, current_user: User ) -> ScriptI
     except Exception as e:
         raise Exception( _( 'Could not read file: {error}' ).format( error = str( e ) ) )
 
-    metadata, warnings = scriptinfo_block_parser( script_info )
+    metadata, warnings = scriptinfo_block_parser( script_info, text = text )
 
     if not metadata:
         try:
-            metadata, warnings = extract_script_metadata( script_info )
+            metadata, warnings = extract_script_metadata( script_info, text = text )
 
         except:
             raise ScriptInfoError( _( 'No valid ScriptInfo was found in the script' ) )
@@ -171,14 +184,53 @@ def _read_scriptfile( file: str, directory: str, current_user: User ) -> ScriptI
     except Exception as e:
         raise
 
+    _check_breakpoints( script_info, text = text )
+
     return script_info, warnings
 
 
-def get_scripts( output_queue: Queue, app_state: ApplicationState, app_run_state: ApplicationRunState ) -> list[ ScriptInfo ]:
+def _read_scriptfile_cached( entry: os.DirEntry, current_user: User ) -> tuple[ ScriptInfo, dict ]:
+    """ Get script information from cache, reading the script file only if it was modified since last read
+
+    Args:
+        entry (os.DirEntry): Directory entry of the script file
+        current_user (User): AD object for current user
+
+    Returns:
+        (tuple[ ScriptInfo, dict ]): Script info and parse warnings
+    """
+
+    mtime: int = entry.stat().st_mtime_ns
+    cached: tuple[ int, ScriptInfo, dict ] | None = _SCRIPT_CACHE.get( entry.path )
+
+    if cached and cached[ 0 ] == mtime:
+
+        return cached[ 1 ], cached[ 2 ]
+
+    script_info, warnings = _read_scriptfile( file = entry.name, path = entry.path, current_user = current_user )
+    _SCRIPT_CACHE[ entry.path ] = ( mtime, script_info, warnings )
+
+    return script_info, warnings
+
+
+def _script_sort_key( script_info: ScriptInfo ) -> tuple[ bool, str ]:
+    """ Sort key for listed scripts, application test files first, then by synopsis
+
+    Args:
+        script_info (ScriptInfo): Info about the script
+
+    Returns:
+        (tuple[ bool, str ]): Bucket and synopsis of the script
+    """
+
+    return ( not script_info.filename.startswith( 'AMTest_' ), script_info.scriptmeta.synopsis )
+
+
+def get_scripts( output_queue: SimpleQueue, app_state: ApplicationState, app_run_state: ApplicationRunState ) -> list[ ScriptInfo ]:
     """ Get script files and parse for any ScriptInfo
 
     Args:
-        output_queue (Queue): Output queue for info output
+        output_queue (SimpleQueue): Output queue for info output
         app_state (ApplicationState): General state of application
         app_run_state (ApplicationRunState): Is application launched in development state
 
@@ -186,43 +238,40 @@ def get_scripts( output_queue: Queue, app_state: ApplicationState, app_run_state
         list[ ScriptInfo ]: A list of available scripts
     """
 
-    from automation_menu.utils.localization import _
-
-    # Setup file pattern
-    pattern: str = r'^(?!(__init__)|(GeneralTestFile)).*\.p((y)|(s1))$'
-    application_test_files: list[ ScriptInfo ] = []
-    indexed_files: list[ ScriptInfo ] = []
+    listed_scripts: list[ ScriptInfo ] = []
     scriptswithbreakpoint: list[ ScriptInfo] = []
     script_dir: WindowsPath = app_state.secrets.get( 'script_dir_path' )
 
-    for i, filename in enumerate(
-        sorted(
-            [
-                f for f in os.listdir( script_dir )
-                if os.path.isfile( os.path.join( script_dir, f ) ) and re.match( pattern = pattern , string = f )
-            ],
-            key = lambda x: x.lower()
-        )
-    ):
-        if filename.startswith( 'AMTest_' ) and app_run_state == ApplicationRunState.PROD:
-            continue
+    with os.scandir( script_dir ) as dir_entries:
+        script_entries: list[ os.DirEntry ] = [ e for e in dir_entries if e.is_file() and SCRIPT_FILENAME_RE.match( e.name ) ]
 
-        try:
-            script_info, parse_warnings = _read_scriptfile( file = filename, directory = script_dir, current_user = app_state.current_user )
+    script_entries.sort( key = _entry_sort_key )
 
-            # Guard against format changes that has not been implemented
-            for key in ( 'keys', 'values', 'other' ):
-                if key not in parse_warnings:
-                    raise ValueError( _( 'parse_warnings missing key {key}' ).format( key = key ) )
+    if app_run_state == ApplicationRunState.PROD:
+        script_entries = [ e for e in script_entries if not e.name.startswith( 'AMTest_' ) ]
+
+    # Reading and parsing is I/O-bound and independent per file, results are collected in listing order
+    with ThreadPoolExecutor( max_workers = max( 1, min( DISCOVERY_MAX_WORKERS, len( script_entries ) ) ) ) as executor:
+        read_futures: list[ tuple[ str, Future ] ] = [
+            ( entry.name, executor.submit( _read_scriptfile_cached, entry = entry, current_user = app_state.current_user ) )
+            for entry in script_entries
+        ]
 
-            if len( parse_warnings[ 'keys' ] ) > 0:
-                raise ValueError( _( 'ScriptInfo contained fields that are not valid, or are misspelled: {names}' ).format( names = ', '.join( parse_warnings[ 'keys' ] ) ) )
+    for filename, read_future in read_futures:
+        try:
+            script_info, parse_warnings = read_future.result()
 
-            if len( parse_warnings[ 'values' ] ) > 0:
-                raise ValueError( _( 'ScriptInfo contained values that are not valid, or are misspelled: {names}' ).format( names = ', '.join( parse_warnings[ 'values' ] ) ) )
+            # Guard against format changes that has not been implemented
+            missing_keys: set[ str ] = PARSE_WARNING_KEYS - parse_warnings.keys()
+            if missing_keys:
+                raise ValueError( _( 'parse_warnings missing key {key}' ).format( key = ', '.join( sorted( missing_keys ) ) ) )
 
-            if len( parse_warnings[ 'other' ] ) > 0:
-                raise ValueError( _( 'Parsing ScriptInfo generated error for these fields: {names}' ).format( names = ', '.join( parse_warnings[ 'other' ] ) ) )
+            if any( parse_warnings.values() ):
+                for key, message in ( ( 'keys', _( 'ScriptInfo contained fields that are not valid, or are misspelled: {names}' ) ),
+                                      ( 'values', _( 'ScriptInfo contained values that are not valid, or are misspelled: {names}' ) ),
+                                      ( 'other', _( 'Parsing ScriptInfo generated error for these fields: {names}' ) ) ):
+                    if parse_warnings[ key ]:
+                        raise ValueError( message.format( names = ', '.join( parse_warnings[ key ] ) ) )
 
             approved: int = _approve_listing( script_info = script_info, app_run_state = app_run_state, current_user = app_state.current_user )
 
@@ -233,11 +282,7 @@ def get_scripts( output_queue: Queue, app_state: ApplicationState, app_run_state
                 if approved == 1:
                     scriptswithbreakpoint.append( script_info )
 
-                if filename.startswith( 'AMTest_' ):
-                    application_test_files.append( script_info )
-
-                else:
-                    indexed_files.append( script_info )
+                listed_scripts.append( script_info )
 
         except ScriptInfoError as e:
             output_queue.put( { 'line': _( '{filename} not loaded: {e}' ).format( filename = filename, e = repr( e ) ),
@@ -261,14 +306,13 @@ def get_scripts( output_queue: Queue, app_state: ApplicationState, app_run_state
 
     if len( scriptswithbreakpoint ) > 0:
         line: str = _( 'Some script have an active breakpoint in the code, handling this has not been implemented, so these will not be available:' )
-        output_queue.put( { 'line': '' ,
-                           'tag': OutputStyleTags.SYSINFO
-                           } )
-        output_queue.put( { 'line': line,
-                           'tag': OutputStyleTags.SYSWARNING
-                           } )
-        output_queue.put( { 'line': ', '.join( [ script.get_attr( 'filename' ) for script in scriptswithbreakpoint ] ),
-                           'tag': OutputStyleTags.SYSWARNING
-                           } )
-
-    return sorted( application_test_files, key = attrgetter( 'scriptmeta.synopsis' ) ) + sorted( indexed_files, key = attrgetter( 'scriptmeta.synopsis' ) )
+        output_queue.put( [ { 'line': '' ,
+                             'tag': OutputStyleTags.SYSINFO
+                             },
+                            { 'lines': [ line, ', '.join( [ script.filename for script in scriptswithbreakpoint ] ) ],
+                             'tag': OutputStyleTags.SYSWARNING
+                             } ] )
+
+    listed_scripts.sort( key = _script_sort_key )
+
+    return listed_scripts
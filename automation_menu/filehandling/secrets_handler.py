@@ -21,5 +21,6 @@ def read_secrets_file( file_path: str ) -> dict:
         (dict): Dict containing secret data
     """
 
-    with open( file_path, mode = 'r', encoding = 'utf-8' ) as f:
-        return json.load( f )
+    # json detects the UTF-8 encoding itself, skipping the text layer
+    with open( file_path, mode = 'rb' ) as f:
+        return json.loads( f.read() )
@@ -31,8 +31,9 @@ def read_settingsfile( settings_file_path: str, debug_logger: Logger ) -> dict:
     """
 
     try:
-        with open( settings_file_path, mode = 'r', encoding = 'utf-8' ) as f:
-            return json.load( f )
+        # json detects the UTF-8 encoding itself, skipping the text layer
+        with open( settings_file_path, mode = 'rb' ) as f:
+            return json.loads( f.read() )
 
     except Exception as e:
         debug_logger.error( msg = f'Error reading settings file:\n{ e }' )
@@ -16,7 +16,7 @@ from dataclasses import dataclass
 from automation_menu.core.script_menu_item import ScriptMenuItem
 
 
-@dataclass
+@dataclass( slots = True )
 class ApplicationState:
     """ State vault for application data """
 
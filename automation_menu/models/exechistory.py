@@ -16,28 +16,39 @@ if TYPE_CHECKING:
 
 import json
 
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass( slots = True, frozen = True, eq = False, repr = False )
 class Output:
     out_time: datetime
     output: str
+    _time_str: str = field( init = False, repr = False, compare = False )
+
+    def __post_init__( self ) -> None:
+        """ Format the output time once, output is not changed after creation """
+
+        t: datetime = self.out_time
+        object.__setattr__( self, '_time_str', f'{t.hour:02d}:{t.minute:02d}:{t.second:02d}' )
+
 
     def __repr__( self ) -> str:
-        """ Custom representation """
+        """ Custom representation, same format as the str of a dict with time and output """
 
-        return str( { 'time': str( self.out_time ), 'output': self.output } )
+        return f"{{'time': { str( self.out_time )!r }, 'output': { self.output!r }}}"
 
 
     def __str__( self ) -> str:
         """ Custom string conversion """
 
-        return f'{ self.out_time.strftime( '%H:%M:%S' ) }: { self.output }'
+        return f'{ self._time_str }: { self.output }'
 
 
 class ExecHistory:
+    __slots__ = ( 'script_info', 'output', 'start', 'end', 'exit_code', 'was_terminated', '_start_iso' )
+
     def __init__( self, script_info: ScriptInfo = None ) -> None:
         """ Class to hold script execution history
 
@@ -46,8 +57,9 @@ class ExecHistory:
         """
 
         self.script_info: ScriptInfo = script_info
-        self.output: list[ Output ] = []
+        self.output: deque[ Output ] = deque()
         self.start: datetime = datetime.now()
+        self._start_iso: str = self.start.isoformat()
         self.end: datetime = None
         self.exit_code: int = None
         self.was_terminated: bool = False
@@ -67,7 +79,7 @@ class ExecHistory:
                 'return_code': self.exit_code,
                 'was_terminated': self.was_terminated
             },
-            'script_output': ';'.join( [ repr( o ) for o in self.output ] )
+            'script_output': ';'.join( map( repr, self.output ) )
             }
 
         return json.dumps( repr_str )
@@ -118,7 +130,7 @@ class ExecHistory:
                 'author': self.script_info.scriptmeta.author
             },
             'execution': {
-                'start': self.start.isoformat(),
+                'start': self._start_iso,
                 'end': self.end.isoformat() if self.end else None,
                 'exit_code': self.exit_code
             },
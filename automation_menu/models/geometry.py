@@ -13,7 +13,7 @@ from typing import TYPE_CHECKING
 
 from dataclasses import dataclass
 
-@dataclass
+@dataclass( slots = True, frozen = True )
 class Geometry:
 
     height: int = 0
@@ -15,23 +15,17 @@ from automation_menu.models.scriptmetadata import ScriptMetadata
 from automation_menu.models.user import User
 
 
-@dataclass
+# Marks an attribute that is not set, as None is a valid value
+_MISSING: object = object()
+
+
+@dataclass( slots = True )
 class ScriptInfo:
     """ Class to hold information about a script """
     filename: str
     fullpath: Path
     scriptmeta: ScriptMetadata = None
-
-
-    def add_attr( self, attr_name: str, attr_val: any ) -> None:
-        """ Add an attribute to the ScriptInfo object
-
-        Args:
-            attr_name (str): Name of attribute to add
-            attr_val (any): Value to add
-        """
-
-        setattr( self, attr_name, attr_val )
+    using_breakpoint: bool = False
 
 
     def get_attr( self, attr_name: str ) -> any:
@@ -41,43 +35,21 @@ class ScriptInfo:
             attr_name (str): Name of attribute to retrieve
         """
 
-        if hasattr( self, attr_name ):
-            return getattr( self, attr_name )
+        value: any = getattr( self, attr_name, _MISSING )
+
+        if value is _MISSING:
 
-        else:
-            if hasattr( self.scriptmeta, attr_name ):
-                return getattr( self.scriptmeta, attr_name )
+            return getattr( self.scriptmeta, attr_name, None )
 
-            else:
-                return None
+        return value
 
 
     def is_author( self, user: User ) -> bool:
         """ Verify if the user is author of this script """
 
-        author_name: str = self.get_attr( 'author' )
+        author_name: str = self.scriptmeta.normalized_author
 
         return (
             bool( author_name )
-            and user.AdObject.name.value == author_name.replace( ' (', '(' )
+            and user.ad_name == author_name
         )
-
-
-
-    def set_attr( self, attr_name: str, attr_val:any, append: bool = False ) -> None:
-        """ Append a value to an existing attribute or create it if it doesn't exist
-
-        Args:
-            attr_name (str): Name of attribute
-            attr_val (any): Value of attribute to set
-            append (bool): Should the value be appended to existing value
-        """
-
-        if ( not hasattr( self, attr_name ) ):
-            self.add_attr( attr_name, attr_val )
-
-        elif append:
-            setattr( self, attr_name, getattr( self, attr_name ) + attr_val )
-
-        else:
-            setattr( self, attr_name, attr_val )
@@ -11,7 +11,7 @@ Created: 2025-10-17
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass( slots = True, frozen = True, eq = False )
 class ScriptInputParameter:
     """ Represents a single input parameter """
 
@@ -15,7 +15,7 @@ from automation_menu.models.enums import ScriptState
 from automation_menu.models.scriptinputparameter import ScriptInputParameter
 
 
-@dataclass
+@dataclass( slots = True, kw_only = True, eq = False )
 class ScriptMetadata:
     """ Complete metadata for a script """
 
@@ -29,8 +29,8 @@ class ScriptMetadata:
     version: str = '1.0'
 
     # Access control
-    required_ad_groups: list[ str ] = field( default_factory = list )
-    allowed_users: list[ str ] = field( default_factory = list )
+    required_ad_groups: frozenset[ str ] = field( default_factory = frozenset )
+    allowed_users: frozenset[ str ] = field( default_factory = frozenset )
 
     # Parameters
     script_input_parameters: list[ ScriptInputParameter ] = field( default_factory = list )
@@ -38,6 +38,11 @@ class ScriptMetadata:
     # UI behavior flags
     disable_minimize_on_running: bool = False
 
+    # Derived fields
+    normalized_author: str = field( init = False, repr = False, compare = False )
+    _has_input_parameters: bool = field( init = False, repr = False, compare = False )
+    _requires_permission_check: bool = field( init = False, repr = False, compare = False )
+
 
     def __post_init__( self ):
         """ Validate after initialization """
@@ -48,14 +53,25 @@ class ScriptMetadata:
         if not self.author:
             raise ValueError( 'Author is required' )
 
+        # Parsers give lists, store as sets for membership checks, without empty entries from trailing separators
+        self.required_ad_groups = frozenset( g.strip() for g in self.required_ad_groups if g.strip() )
+        self.allowed_users = frozenset( u.strip() for u in self.allowed_users if u.strip() )
+
+        # Author name in the form used by the AD name attribute
+        self.normalized_author = self.author.replace( ' (', '(' )
+
+        # Metadata is not changed after parsing, answer the checks from flags
+        self._has_input_parameters = len( self.script_input_parameters ) > 0
+        self._requires_permission_check = bool( self.required_ad_groups or self.allowed_users )
+
 
     def has_input_parameters( self ) -> bool:
         """ Check if script accepts parameters """
 
-        return len( self.script_input_parameters ) > 0
+        return self._has_input_parameters
 
 
-    def requires_permission_check(self) -> bool:
+    def requires_permission_check( self ) -> bool:
         """ Check if access control is needed """
 
-        return bool( self.required_ad_groups or self.allowed_users )
+        return self._requires_permission_check
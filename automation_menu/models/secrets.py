@@ -9,37 +9,65 @@ Version: 1.0
 Created: 2025-10-31
 """
 
-import os
+from __future__ import annotations
+
+from dataclasses import dataclass
 from pathlib import Path
 
 
+# Directory holding the scripts to list, next to the application directory
+_SCRIPT_DIR: Path = Path( __file__ ).resolve().parent.parent.parent / 'Script'
+
+# Home directory of the current user, where the settings file is stored
+_HOME: Path = Path.home()
+
+
+@dataclass( slots = True, frozen = True, kw_only = True )
 class Secrets:
-    _secret_dict: dict[ str, bool | Path | str ] = {}
+    """ Data customizable from a config file, read only after creation """
 
-    def __init__( self, new_dict: dict | None ) -> None:
-        """ An enum like class to hold data customizable from a config file
+    domain_name: str
+    error_ss_prefix: str = 'AutoError'
+    ldap_search_base: str | None = None
+    ldap_server: str
+    main_error_mail: str
+    mainwindowtitle: str = 'Automation menu'
+    script_dir_path: Path = _SCRIPT_DIR
+    settings_file_path: Path
+    smtprelay: str
+
+
+    @classmethod
+    def from_dict( cls, new_dict: dict ) -> Secrets:
+        """ Create secrets from the dictionary read from the config file
 
         Args:
-            new_dict (dict | None): Saved data dictionary read from file
+            new_dict (dict): Saved data dictionary read from file
+
+        Returns:
+            (Secrets): Secrets with values from file, or defaults
+
+        Raises:
+            KeyError when a required value is missing
         """
 
-        Secrets._secret_dict[ 'error_ss_prefix' ] = new_dict.get( 'error_ss_prefix', 'AutoError' )
-        Secrets._secret_dict[ 'ldap_search_base' ] = new_dict.get( 'ldap_search_base' )
-        Secrets._secret_dict[ 'ldap_server' ] = new_dict[ 'ldap_server' ]
-        Secrets._secret_dict[ 'main_error_mail' ] = new_dict[ 'main_error_mail' ]
-        Secrets._secret_dict[ 'mainwindowtitle' ] = new_dict.get( 'mainwindowtitle', 'Automation menu' )
-        Secrets._secret_dict[ 'script_dir_path' ] = Path( __file__ ).resolve().parent.parent.parent / "Script"
-        Secrets._secret_dict[ 'settings_file_path' ] = os.path.expanduser( os.path.join( '~', new_dict.get( 'settings_file_name', 'AutomationMenu_Settings_File_Name.json' ) ) )
-        Secrets._secret_dict[ 'smtprelay' ] = new_dict[ 'smtprelay' ]
-        Secrets._secret_dict[ 'domain_name' ] = new_dict[ 'domain_name' ]
+        return cls(
+            domain_name = new_dict[ 'domain_name' ],
+            error_ss_prefix = new_dict.get( 'error_ss_prefix', 'AutoError' ),
+            ldap_search_base = new_dict.get( 'ldap_search_base' ),
+            ldap_server = new_dict[ 'ldap_server' ],
+            main_error_mail = new_dict[ 'main_error_mail' ],
+            mainwindowtitle = new_dict.get( 'mainwindowtitle', 'Automation menu' ),
+            settings_file_path = _HOME / new_dict.get( 'settings_file_name', 'AutomationMenu_Settings_File_Name.json' ),
+            smtprelay = new_dict[ 'smtprelay' ]
+        )
 
 
-    @staticmethod
-    def get( key: str ) -> str:
-        """ Get dict value
+    def get( self, key: str ) -> bool | Path | str:
+        """ Get value by name
 
         Args:
-            key (str): Key of dict
+            key (str): Name of the value
         """
 
-        return Secrets._secret_dict.get( key, "" )
+        return getattr( self, key, '' )
@@ -15,32 +15,43 @@ from dataclasses import dataclass, field
 from automation_menu.models.sequencestep import SequenceStep
 
 
-@dataclass
+@dataclass( slots = True, kw_only = True )
 class Sequence:
     """ Define an automatic run sequence """
 
     description: str = ''
     id: str = ''
     name: str = ''
-    steps: list[ SequenceStep ] = field( default_factory = list[ SequenceStep ] )
+    steps: list[ SequenceStep ] = field( default_factory = list )
     stop_on_error: bool = False
 
+    # Dict from the last to_dict, cleared by mark_dirty
+    _cached_dict: dict | None = field( default = None, init = False, repr = False, compare = False )
+
+
+    def mark_dirty( self ) -> None:
+        """ Sequence or its steps have been changed, rebuild the dict on next to_dict """
+
+        self._cached_dict = None
+
 
     def to_dict( self ) -> dict:
-        """ Transform sequence to a dict
+        """ Transform sequence to a dict, reused until mark_dirty is called
 
         Returns:
             (dict): Sequence as a dict
         """
 
-        steps: list[ dict ] = []
-        for step in self.steps:
-            steps.append( step.to_dict() )
+        if self._cached_dict is not None:
+
+            return self._cached_dict
 
-        return {
+        self._cached_dict = {
             'id': self.id,
             'name': self.name,
             'description': self.description,
             'stop_on_error': self.stop_on_error,
-            'steps': steps
-        }
\ No newline at end of file
+            'steps': [ step.to_dict() for step in self.steps ]
+        }
+
+        return self._cached_dict
\ No newline at end of file
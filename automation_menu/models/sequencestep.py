@@ -15,11 +15,11 @@ from dataclasses import dataclass, field
 from automation_menu.models.scriptinfo import ScriptInfo
 
 
-@dataclass
+@dataclass( slots = True, kw_only = True )
 class SequenceStep:
     """ Definition of a sequence step """
 
-    pre_set_parameters: dict[ str, str ] = field( default_factory = dict[ str, str ] )
+    pre_set_parameters: list[ dict[ str, str ] ] = field( default_factory = list )
     script_file: str | None = None
     script_info: ScriptInfo | None = None
     step_index: int | None = None
@@ -33,24 +33,17 @@ class SequenceStep:
             (dict): Sequence step as a dict
         """
 
-        from automation_menu.utils.localization import _
+        parameters: list[ dict[ str, str ] ] = self.pre_set_parameters or []
+        invalid: dict | None = next( ( p for p in parameters if not isinstance( p, dict ) or 'name' not in p or 'set' not in p ), None )
 
-        parameters: list[ dict ] = []
+        if invalid is not None:
+            from automation_menu.utils.localization import _
 
-        if self.pre_set_parameters:
-            for i, param in enumerate( self.pre_set_parameters ):
-                if not isinstance( param, dict ) or 'name' not in param or 'set' not in param:
-
-                    raise ValueError( _( 'Invalid pre_set_parameters for step {f}: {p}' ).format( f = self.script_file, p = param ) )
-
-                parameters.append( {
-                    'name': param[ 'name' ],
-                    'set': param[ 'set' ]
-                } )
+            raise ValueError( _( 'Invalid pre_set_parameters for step {f}: {p}' ).format( f = self.script_file, p = invalid ) )
 
         return {
             'script_file': self.script_file,
             'stop_on_error': self.stop_on_error,
             'step_index': self.step_index,
-            'pre_set_parameters': parameters
+            'pre_set_parameters': [ { 'name': p[ 'name' ], 'set': p[ 'set' ] } for p in parameters ]
         }
\ No newline at end of file
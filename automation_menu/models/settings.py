@@ -9,14 +9,40 @@ Created: 2025-10-31
 """
 
 from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from tkinter import Misc
 
 import json
+from operator import attrgetter
 from typing import Callable
 
 from automation_menu.models.sequence import Sequence
 
 
+# Names of all settings, in the order they are written to file
+_SETTING_NAMES: tuple[ str, ... ] = (
+    'current_language',
+    'force_focus_post_execution',
+    'include_ss_in_error_mail',
+    'keepass_shortcut',
+    'minimize_on_running',
+    'on_top',
+    'send_mail_on_error',
+    'saved_sequences',
+)
+
+# Getters for settings readable by name
+_SETTING_GETTERS: dict[ str, attrgetter ] = { key: attrgetter( key ) for key in _SETTING_NAMES }
+
+# Milliseconds to wait for further changes before saving settings to file
+SAVE_DELAY_MS: int = 150
+
+
 class Settings:
+    __slots__ = ( '_dirty', '_save_after_id', '_save_callback', '_scheduler' ) + _SETTING_NAMES
+
     def __init__( self, settings_dict: dict = None, save_callback: Callable = None ) -> None:
         """ Class to hold application settings
 
@@ -25,222 +51,140 @@ class Settings:
             save_callback (Callable): Callback function for saving to file
         """
 
+        self._dirty: bool = False
+        self._save_after_id: str | None = None
         self._save_callback: Callable = save_callback
-        self._current_language: str = settings_dict.get( 'current_language', 'sv_SE' )
-        self._force_focus_post_execution: bool = settings_dict.get( 'force_focus_post_execution', False )
-        self._include_ss_in_error_mail: bool = settings_dict.get( 'include_ss_in_error_mail', False )
-        self._keepass_shortcut: dict[ str, bool | str ] = settings_dict.get( 'keepass_shortcut', { 'ctrl': False, 'alt': False, 'shift': False, 'key': '' } )
-        self._minimize_on_running: bool = settings_dict.get( 'minimize_on_running', False )
-        self._on_top: bool = settings_dict.get( 'on_top', False )
-        self._send_mail_on_error: bool = settings_dict.get( 'send_mail_on_error', False )
-
-        self._saved_sequences: dict[ str, Sequence ] = settings_dict.get( 'saved_sequences', [] )
-
-
-    @property
-    def current_language( self ) -> str:
-        """ Property function to get 'current_language' """
-
-        return self.get( 'current_language' )
-
-
-    @current_language.setter
-    def current_language( self, value: str ) -> None:
-        """ Property setter function to set 'current_language'
-
-        Args:
-            value (str): Language tag string to set
-        """
-
-        self._current_language = value
+        self._scheduler: Misc | None = None
+        self.current_language: str = settings_dict.get( 'current_language', 'sv_SE' )
+        self.force_focus_post_execution: bool = settings_dict.get( 'force_focus_post_execution', False )
+        self.include_ss_in_error_mail: bool = settings_dict.get( 'include_ss_in_error_mail', False )
+        self.keepass_shortcut: dict[ str, bool | str ] = settings_dict.get( 'keepass_shortcut', { 'ctrl': False, 'alt': False, 'shift': False, 'key': '' } )
+        self.minimize_on_running: bool = settings_dict.get( 'minimize_on_running', False )
+        self.on_top: bool = settings_dict.get( 'on_top', False )
+        self.send_mail_on_error: bool = settings_dict.get( 'send_mail_on_error', False )
 
-        if self._save_callback:
-            self._save_callback( self )
+        self.saved_sequences: dict[ str, Sequence ] = settings_dict.get( 'saved_sequences', [] )
 
 
-    @property
-    def force_focus_post_execution( self ) -> str:
-        """ Property function to get 'force_focus_post_execution' """
-
-        return self.get( 'force_focus_post_execution' )
-
-
-    @force_focus_post_execution.setter
-    def force_focus_post_execution( self, value: bool ) -> None:
-        """ Property setter function to set 'force_focus_post_execution'
-
-        Args:
-            value (bool): Value to set
-        """
-
-        self._force_focus_post_execution = value
-
-        if self._save_callback:
-            self._save_callback( self )
-
-
-    @property
-    def include_ss_in_error_mail( self ) -> None:
-        """ Property function to get 'on_top' """
-
-        return self.get( 'include_ss_in_error_mail' )
-
-
-    @include_ss_in_error_mail.setter
-    def include_ss_in_error_mail( self, value: bool ) -> None:
-        """ Property setter function to set 'include_ss_in_error_mail'
-
-        Args:
-            value (bool): Value to set
+    def _schedule_save( self ) -> None:
+        """ Mark settings as changed and schedule a save, unless one is already pending
+        Without a scheduler, settings are saved at once
         """
 
-        self._include_ss_in_error_mail = value
+        if not self._save_callback:
 
-        if self._save_callback:
-            self._save_callback( self )
+            return
 
+        self._dirty = True
 
-    @property
-    def keepass_shortcut( self ) -> dict:
-        """ Property function to get 'keepass_shortcut' """
+        if self._scheduler is None:
+            self.flush()
 
-        return self.get( 'keepass_shortcut' )
+        elif self._save_after_id is None:
+            self._save_after_id = self._scheduler.after( SAVE_DELAY_MS, self.flush )
 
 
-    @keepass_shortcut.setter
-    def keepass_shortcut( self, value: dict ) -> None:
-        """ Property setter function to set 'keepass_shortcut'
+    def bind_scheduler( self, scheduler: Misc ) -> None:
+        """ Delay saves with the Tk event loop of a widget, so saving stays in the UI thread
 
         Args:
-            value (dict): Value to set
+            scheduler (Misc): Tk widget whose after is used to schedule saves
         """
 
-        self._keepass_shortcut = value
-
-        if self._save_callback:
-            self._save_callback( self )
+        self._scheduler = scheduler
 
 
-    @property
-    def minimize_on_running( self ) -> bool:
-        """ Property function to get 'on_top' """
+    def flush( self ) -> None:
+        """ Save pending changes to file now, and cancel any scheduled save
 
-        return self.get( 'minimize_on_running' )
-
-
-    @minimize_on_running.setter
-    def minimize_on_running( self, value: bool ) -> None:
-        """ Property setter function to set 'minimize_on_running'
-
-        Args:
-            value (bool): Value to set
+        Raises:
+            Exception from the save callback, changes stay pending for the next save
         """
 
-        self._minimize_on_running = value
+        if self._save_after_id is not None:
+            self._scheduler.after_cancel( self._save_after_id )
+            self._save_after_id = None
 
-        if self._save_callback:
-            self._save_callback( self )
+        if self._dirty and self._save_callback:
+            self._dirty = False
 
+            try:
+                self._save_callback( self )
 
-    @property
-    def on_top( self ) -> bool:
-        """ Property function to get 'on_top' """
+            except Exception:
+                self._dirty = True
 
-        return self.get( 'on_top' )
+                raise
 
 
-    @on_top.setter
-    def on_top( self, value: bool ) -> None:
-        """ Property setter function to set 'on_top'
+    def get( self, key: str ) -> any:
+        """ Get attribute with requested name
 
         Args:
-            value (bool): Value to set
-        """
-
-        self._on_top = value
-
-        if self._save_callback:
-            self._save_callback( self )
-
-
-    @property
-    def saved_sequences( self ) -> list[ Sequence ]:
-        """ Property function to get 'saved_sequences'
-
-        Returns:
-            (list[ Sequence ]): List of available sequences
+            key (str): Name of setting
         """
 
-        return self.get( 'saved_sequences' )
+        return _SETTING_GETTERS[ key ]( self )
 
 
-    @saved_sequences.setter
-    def saved_sequences( self, value: list[ Sequence ] ) -> None:
-        """ Property setter function to set 'saved_sequences'
+    def set( self, key: str, value: any ) -> None:
+        """ Set a setting and schedule a save to file, unchanged values are not saved
 
         Args:
-            value (list[ Sequence ]): List of sequences to save
+            key (str): Name of setting
+            value (any): Value to set
         """
 
-        self._saved_sequences = value
-
-        if self._save_callback:
-            self._save_callback( self )
+        if _SETTING_GETTERS[ key ]( self ) == value:
 
+            return
 
-    @property
-    def send_mail_on_error( self ) -> bool:
-        """ Property function to get 'send_mail_on_error' """
+        setattr( self, key, value )
 
-        return self.get( 'send_mail_on_error' )
+        self._schedule_save()
 
 
-    @send_mail_on_error.setter
-    def send_mail_on_error( self, value: bool ) -> None:
-        """ Property setter function to set 'send_mail_on_error'
+    def set_keepass_shortcut( self, value_tup: tuple[ bool, bool, bool, str ] ) -> None:
+        """ Set value of 'keepass_shortcut'
 
         Args:
-            value (bool): Value to set
+            value_tup (tuple[ bool, bool, bool, str ]): Shortcut definition to safe
         """
 
-        self._send_mail_on_error = value
-
-        if self._save_callback:
-            self._save_callback( self )
+        if self.keepass_shortcut.get( value_tup[ 0 ] ) == value_tup[ 1 ]:
 
+            return
 
-    def get( self, key: str ) -> any:
-        """ Get attribute with requested name
-
-        Args:
-            key (str): Key of dict
-        """
+        self.keepass_shortcut[ value_tup[ 0 ] ] = value_tup[ 1 ]
 
-        return getattr( self, f'_{ key }' )
+        self._schedule_save()
 
 
-    def set_keepass_shortcut( self, value_tup: tuple[ bool, bool, bool, str ] ) -> None:
-        """ Set value of 'keepass_shortcut'
+    def to_dict( self ) -> dict[ str, bool | str ]:
+        """ Convert settings to a JSON-serializable dictionary
 
-        Args:
-            value_tup (tuple[ bool, bool, bool, str ]): Shortcut definition to safe
+        Returns:
+            (dict): Settings keyed by setting name
         """
 
-        self._keepass_shortcut[ value_tup[ 0 ] ] = value_tup[ 1 ]
-
-        if self._save_callback:
-            self._save_callback( self )
+        # Keys in the order of _SETTING_NAMES, written out since the set of settings is fixed
+        return {
+            'current_language': self.current_language,
+            'force_focus_post_execution': self.force_focus_post_execution,
+            'include_ss_in_error_mail': self.include_ss_in_error_mail,
+            'keepass_shortcut': self.keepass_shortcut,
+            'minimize_on_running': self.minimize_on_running,
+            'on_top': self.on_top,
+            'send_mail_on_error': self.send_mail_on_error,
+            'saved_sequences': self.saved_sequences
+        }
 
 
-    def to_json( self ) -> dict[ str, bool | str ]:
-        """ Convert settings to a JSON-serializable dictionary
+    def to_json( self ) -> str:
+        """ Convert settings to a JSON string
 
         Returns:
-            (dict): Json formated dict of setting object
+            (str): Json formated string of setting object
         """
 
-        d: dict[ str, bool | str ] = { k.lstrip( '_' ): v
-             for k, v in self.__dict__.items()
-             if not callable( self.__dict__[ k ] ) }
-
-        return json.dumps( d, indent = 2 )
+        return json.dumps( self.to_dict(), indent = 2 )
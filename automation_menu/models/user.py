@@ -8,10 +8,35 @@ Version: 1.0
 Created: 2025-10-31
 """
 
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ldap3.abstract.entry import Entry
+
 import os
 import re
+import sys
+
+from functools import cached_property, lru_cache
+
+
+# Characters giving a group name regex meaning, names without them are matched as plain text
+_REGEX_METACHARACTERS: frozenset[ str ] = frozenset( '.^$*+?{}[]\\|()' )
+
+
+@lru_cache( maxsize = 128 )
+def _compile_group_pattern( pattern: str ) -> re.Pattern:
+    """ Compile a group name pattern, compiled patterns are kept for reuse
+
+    Args:
+        pattern (str): Regex pattern for group name
+
+    Returns:
+        (re.Pattern): Compiled pattern
+    """
 
-from ldap3.abstract.entry import Entry
+    return re.compile( pattern )
 
 
 class User:
@@ -21,13 +46,78 @@ class User:
 
         self.UserId: str = os.getenv( key = 'USERNAME' ,default = 'DefaultUser' )
         self.AdObject: Entry = ad_object
+        self._membership_cache: dict[ str, bool ] = {}
+
+
+    def _match_group( self, group_to_check: str ) -> bool:
+        """ Match a group name, pattern or distinguished name against the users groups
+
+        Args:
+            group_to_check (str): Group to match
+
+        Returns:
+            (bool): True if any of the users groups match
+        """
+
+        # Full distinguished name given
+        if group_to_check in self._memberof_set:
+
+            return True
+
+        if _REGEX_METACHARACTERS.isdisjoint( group_to_check ):
+
+            return any( group_to_check in g for g in self.memberof )
+
+        pattern: re.Pattern = _compile_group_pattern( group_to_check )
+
+        return any( pattern.search( g ) for g in self.memberof )
+
+
+    @cached_property
+    def _memberof_set( self ) -> frozenset[ str ]:
+        """ Distinguished names of the users groups, for exact lookups """
+
+        return frozenset( self.memberof )
+
+
+    @cached_property
+    def ad_name( self ) -> str:
+        """ Name of the user in Active Directory, read from the AD object once """
+
+        return self.AdObject.name.value
 
 
     def is_member_of( self, group_to_check: str ) -> bool:
-        """ Check if the user is a member of a specific group """
+        """ Check if the user is a member of a specific group, each group is matched once per user """
+
+        result: bool | None = self._membership_cache.get( group_to_check )
+
+        if result is None:
+            result = self._membership_cache[ group_to_check ] = self._match_group( group_to_check = group_to_check )
+
+        return result
+
+
+    def member_of_any( self, groups: frozenset[ str ] ) -> bool:
+        """ Check if the user is a member of at least one of the groups
+
+        Args:
+            groups (frozenset[ str ]): Group names, patterns or distinguished names to check
+
+        Returns:
+            (bool): True if any of the groups match
+        """
+
+        # Any full distinguished name is answered by one set operation
+        if not self._memberof_set.isdisjoint( groups ):
+
+            return True
+
+        return any( self.is_member_of( group_to_check = g ) for g in groups )
+
 
-        for g in self.AdObject.memberof:
-            if re.search( group_to_check , g ):
-                return True
+    @cached_property
+    def memberof( self ) -> tuple[ str, ... ]:
+        """ Distinguished names of the users groups, read from the AD object once """
 
-        return False
+        return tuple( sys.intern( str( g ) ) for g in self.AdObject.memberof )
@@ -8,27 +8,40 @@ Version: 1.0
 Created: 2025-09-25
 """
 
-import asyncio
 import json
 import logging
 import queue
-from re import Match
-import threading
 import tkinter as tk
 
+from collections import deque
 from datetime import datetime
 from logging import Logger
 from tkinter.ttk import Button
 from typing import Callable
 
-from automation_menu.models import SysInstructions
+from automation_menu.api.script_api import MESSAGE_END, MESSAGE_START
+from automation_menu.models import ExecHistory, SysInstructions
 from automation_menu.models.enums import OutputStyleTags
 from automation_menu.ui.history_manager import HistoryManager
+from automation_menu.utils.localization import _
+
+
+# Milliseconds between polls of the output queue, each poll flushes to the text widget (~30 Hz)
+POLL_INTERVAL_MS: int = 33
+
+# Most queue items taken in one poll, so a flooding script can not block the UI
+MAX_ITEMS_PER_POLL: int = 256
+
+# Most lines kept in the output widget, older lines are removed to keep inserts fast
+MAX_OUTPUT_LINES: int = 5000
+
+# Tags of application messages, these are not logged in execution history
+SYSTEM_TAGS: frozenset[ OutputStyleTags ] = frozenset( ( OutputStyleTags.SYSERROR, OutputStyleTags.SYSINFO, OutputStyleTags.SYSWARNING ) )
 
 
 class AsyncOutputController:
     def __init__( self,
-                output_queue: queue.Queue,
+                output_queue: queue.SimpleQueue,
                 text_widget: tk.Text,
                 breakpoint_button: Button,
                 history_manager: HistoryManager,
@@ -38,7 +51,7 @@ class AsyncOutputController:
         """ Controller for output queue
 
         Args:
-            output_queue (queue.Queue): Queue to handle
+            output_queue (queue.SimpleQueue): Queue to handle
             text_widget (tk.Text): Tk Text widget to recieve output text
             breakpoint_button (Button): The button to return execution after breakpoint in script
             history_manager (HistoryManager): History manager to access history list
@@ -47,16 +60,24 @@ class AsyncOutputController:
        """
 
         self.history_manager: HistoryManager = history_manager
-        self.output_queue: queue.Queue = output_queue
+        self.output_queue: queue.SimpleQueue = output_queue
         self.text_widget: tk.Text = text_widget
         self.breakpoint_button: Button = breakpoint_button
         self.api_callbacks: dict[ str, Callable ] = api_callbacks
         self._logger: Logger = logger
 
-        self.loop: asyncio.AbstractEventLoop | None = None
-
         self._running: bool = False
-        self._executor: bool = None
+        self._poll_id: str | None = None
+        self._pending: deque[ dict | SysInstructions ] = deque()
+        self._pending_lines: list[ str ] = []
+        self._pending_lines_tag: str | None = None
+
+        # Builders of UI API calls, by API message type
+        self._api_dispatch: dict[ str, Callable[ [ dict ], dict ] ] = {
+            'progress': self._api_progress,
+            'setting': self._api_setting,
+            'status': self._api_status
+        }
 
 
     def _api_handler( self, handler: str, data: dict ) -> None:
@@ -70,79 +91,90 @@ class AsyncOutputController:
         self.api_callbacks[ handler ]( data )
 
 
-    async def _async_processor( self ) -> None:
-        """ Loop to handle queue insertions """
+    def _api_progress( self, data: dict ) -> dict[ str, dict | str ]:
+        """ Build API call for a progress message
 
-        while self._running:
-            try:
-                queue_item = await self.loop.run_in_executor(
-                    None,
-                    self._get_queue_item
-                )
-
-                if queue_item is None:
-                    break
+        Args:
+            data (dict): Data of the API message
 
-                if queue_item != SysInstructions.PROCESSTERMINATED:
-                    processed = await self._async_process_queue_item( queue_item )
+        Returns:
+            (dict): Dictionary with name of API handler and recieved data
+        """
 
-                    self._schedule_ui_update( processed )
+        value: int | str = data.get( 'set', data.get( 'percent' ) )
+        handler: str = value if isinstance( value, str ) else 'update'
 
-            except Exception as e:
-                logging.error( f'Error in async processor: { e }' )
+        return { 'type': 'api', 'handler': f'{ handler }_progress', 'data': data }
 
 
-    async def _async_process_queue_item( self, queue_item: str | SysInstructions | dict ) -> None | dict:
-        """ Process gathered queue item
+    def _api_setting( self, data: dict ) -> dict[ str, dict | str ]:
+        """ Build API call for a setting message
 
         Args:
-            queue_item (str | SysInstructions | dict): Queue item to process
+            data (dict): Data of the API message
 
         Returns:
-            (dict): Message normalized to a dict
+            (dict): Dictionary with name of API handler and recieved data
         """
 
-        if queue_item == 'timeout':
+        return { 'type': 'api', 'handler': 'setting', 'data': data }
 
-            return None
 
-        elif queue_item == SysInstructions.CLEAROUTPUT:
-            self._handle_ui_update( queue_item = queue_item )
+    def _api_status( self, data: dict ) -> dict[ str, dict | str ]:
+        """ Build API call for a status message
 
-        await asyncio.sleep( 0 )
+        Args:
+            data (dict): Data of the API message
 
-        return self._normalize_queue_item( queue_item )
+        Returns:
+            (dict): Dictionary with name of API handler and recieved data
+        """
 
+        call_type: str = data.get( 'set' )
 
-    def _get_queue_item( self ) -> dict | str:
-        """ Get the last queue item inserted
+        if call_type not in ( 'clear', 'get' ):
+            call_type = 'set'
 
-        Returns:
-            (dict | str): Queue item
+        return { 'type': 'api', 'handler': f'{ call_type }_status', 'data': data }
+
+
+    def _flush_pending( self ) -> None:
+        """ Update UI with all output gathered since last flush
+        The text widget is opened for editing once for the whole batch, and consecutive lines with the same tag are inserted together
         """
 
+        self.text_widget.config( state = 'normal' )
+
         try:
+            while self._pending:
+                self._handle_ui_update( queue_item = self._pending.popleft() )
+
+            self._insert_pending_lines()
 
-            return self.output_queue.get( timeout = 1.5 )
+            # Output lines end with a newline, so the last line of the widget is empty
+            line_count: int = int( self.text_widget.index( 'end-1c' ).split( '.' )[ 0 ] ) - 1
 
-        except queue.Empty:
+            if line_count > MAX_OUTPUT_LINES:
+                self.text_widget.delete( '1.0', f'{ line_count - MAX_OUTPUT_LINES + 1 }.0' )
 
-            return 'timeout'
+        finally:
+            self.text_widget.config( state = 'disabled' )
+
+        self.text_widget.see( 'end' )
 
 
     def _handle_ui_update( self, queue_item: dict | str ) -> None:
-        """ Do the actual UI update
+        """ Do the actual UI update, text widget is expected to be in normal state
+        Output is given as one line in 'line', or as several lines with the same tag in 'lines'
 
         Args:
             queue_item (dict | str): Queued item to update UI from
         """
 
-        from automation_menu.utils.localization import _
-
         if queue_item == SysInstructions.CLEAROUTPUT:
-            self.text_widget.config( state = 'normal' )
+            # Lines not yet inserted would be cleared anyway
+            self._pending_lines.clear()
             self.text_widget.delete( '1.0', tk.END )
-            self.text_widget.config( state = 'disabled' )
 
         elif isinstance( queue_item, dict ):
 
@@ -151,39 +183,59 @@ class AsyncOutputController:
                 data: dict[ str, str ] = queue_item.get( 'data', {} )
 
                 if handler in self.api_callbacks:
-                    self._api_handler( handler = queue_item[ 'handler' ] , data = queue_item[ 'data' ] )
+                    # Output printed before the API call is shown before it takes effect
+                    self._insert_pending_lines()
+                    self._api_handler( handler = handler, data = data )
 
                 else:
                     self._logger.warning( _( 'Unknown API handler {h}' ).format( h = handler ) )
 
             else:
-                line: str = queue_item.get( 'line' )
+                lines: list[ str ] | None = queue_item.get( 'lines' )
                 tag: OutputStyleTags = queue_item.get( 'tag', OutputStyleTags.SYSINFO )
 
-                if line is None:
-                    self._logger.warning( _( 'Queue item missing \'line\': {q}' ).format( q = queue_item ) )
+                if lines is None:
+                    line: str = queue_item.get( 'line' )
 
-                    return
+                    if line is None:
+                        self._logger.warning( _( 'Queue item missing \'line\': {q}' ).format( q = queue_item ) )
 
-                else:
-                    self.text_widget.config( state = 'normal' )
-                    self.text_widget.insert( 'end', queue_item[ 'line' ] + '\n', tag.value )
-                    self.text_widget.config( state = 'disabled' )
-                    self.text_widget.see( 'end' )
-
-                    # Log queue output in exec history
-                    if not queue_item[ 'tag' ].name.startswith( 'SYS' ):
-                        queue_item[ 'exec_item' ].append_output( {
-                            'out_time': datetime.now(),
-                            'output': queue_item[ 'line' ]
+                        return
+
+                    lines = [ line ]
+
+                if tag.value != self._pending_lines_tag:
+                    self._insert_pending_lines()
+                    self._pending_lines_tag = tag.value
+
+                self._pending_lines.extend( lines )
+
+                exec_item: ExecHistory | None = queue_item.get( 'exec_item' )
+
+                # Log queue output in exec history
+                if tag not in SYSTEM_TAGS:
+                    out_time: datetime = datetime.now()
+
+                    for line in lines:
+                        exec_item.append_output( {
+                            'out_time': out_time,
+                            'output': line
                         } )
 
-                    if queue_item.get( 'breakpoint' ):
-                        self.breakpoint_button.config( state = 'normal' )
+                if queue_item.get( 'breakpoint' ):
+                    self.breakpoint_button.config( state = 'normal' )
+
+                elif queue_item.get( 'finished' ):
+                    exec_item.end = datetime.now()
+                    self.history_manager.add_history_item( exec_item )
+
 
-                    elif queue_item.get( 'finished' ):
-                        queue_item[ 'exec_item' ].end = datetime.now()
-                        self.history_manager.add_history_item( queue_item[ 'exec_item' ] )
+    def _insert_pending_lines( self ) -> None:
+        """ Insert gathered lines into the text widget with one call """
+
+        if self._pending_lines:
+            self.text_widget.insert( 'end', '\n'.join( self._pending_lines ) + '\n', self._pending_lines_tag )
+            self._pending_lines.clear()
 
 
     def _normalize_queue_item( self, queue_item: str | dict ) -> dict[ str, dict | OutputStyleTags | str ]:
@@ -204,126 +256,100 @@ class AsyncOutputController:
             }
 
         elif isinstance( queue_item, dict ):
-            if '__API_START__' in queue_item[ 'line' ]:
-                return self._parse_api_message( queue_item )
+            # Batched lines are plain output, API messages are sent one per line
+            if 'lines' in queue_item:
 
-            else:
+                return queue_item
+
+            line: str = queue_item[ 'line' ]
+            start: int = line.find( MESSAGE_START )
+
+            if start < 0:
 
                 return queue_item
 
+            start += len( MESSAGE_START )
+            end: int = line.find( MESSAGE_END, start )
+
+            if end < 0:
+
+                return queue_item
+
+            return self._parse_api_message( payload = line[ start:end ] )
+
         else:
 
             return queue_item
 
 
-    def _parse_api_message( self, queue_item: dict ) -> dict[ str, dict | str ]:
-        """ Parse API call from queue item
+    def _parse_api_message( self, payload: str ) -> dict[ str, dict | str ]:
+        """ Parse API call from the JSON between the API markers of a queue item
 
         Args:
-            queue_item (dict): Queue item to parse
+            payload (str): JSON text of the API message
 
         Returns:
             (dict): Dictionary with name of API handler and recieved data
         """
 
-        import re
-
-        match: Match = re.search( r'__API_START__(.+?)__API_END__', string = queue_item[ 'line' ] )
-
-        if match:
+        if payload:
             try:
-                api_msg = json.loads( match.group( 1 ) )
-
-                if api_msg[ 'type' ] == 'progress':
-                    data = api_msg.get( 'data' ).get( 'set', api_msg.get( 'data' ).get( 'percent' ) )
-                    handler = 'update'
-
-                    if isinstance( data, str ):
-                        handler = data
-
-                    return { 'type': 'api', 'handler': f'{ handler }_progress', 'data': api_msg[ 'data' ] }
-
-                elif api_msg[ 'type' ] == 'status':
-                    call_type = api_msg.get( 'data' ).get( 'set' )
-
-                    if call_type not in ( 'clear', 'get' ):
-                        call_type = 'set'
-
-                    return { 'type': 'api', 'handler': f'{ call_type }_status', 'data': api_msg[ 'data' ] }
-
-                elif api_msg[ 'type' ] == 'setting':
+                api_msg: dict = json.loads( payload )
+                build_api_call: Callable[ [ dict ], dict ] | None = self._api_dispatch.get( api_msg[ 'type' ] )
 
-                    return { 'type': 'api', 'handler': 'setting', 'data': api_msg.get( 'data' ) }
+                if build_api_call:
 
+                    return build_api_call( api_msg[ 'data' ] )
 
             except json.JSONDecodeError as e:
-                from automation_menu.utils.localization import _
-
                 self._logger.error( _( 'Couldn\'t decode API JSON:\n{e}' ).format( e = e ) )
  
                 pass
 
 
-    def _run_async_loop( self ) -> None:
-        """" Startup the async loop """
-
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop( self.loop )
+    def _poll( self ) -> None:
+        """ Move queued items to the text widget, runs in the Tk main loop until closedown """
 
         try:
-            self.loop.run_until_complete( self._async_processor() )
-
-        except Exception as e:
-            from automation_menu.utils.localization import _
-
-            logging.exception( _( 'Error in async loop: %s' ).format( e = e ) )
+            for _i in range( MAX_ITEMS_PER_POLL ):
+                try:
+                    queue_item = self.output_queue.get_nowait()
 
-        finally:
-            self.loop.close()
-
-
-    def _schedule_ui_update( self, processed_queue_item: dict ) -> None:
-        """ Schedule UI update with the processed message
-
-        Args:
-            processed_queue_item (dict): Queued item to schedule update for
-        """
-
-        if processed_queue_item:
-            self.text_widget.after( 0, lambda: self._handle_ui_update( processed_queue_item ) )
+                except queue.Empty:
+                    break
 
+                if queue_item != SysInstructions.PROCESSTERMINATED:
+                    # Several messages can be queued at once as a list
+                    for item in ( queue_item if isinstance( queue_item, list ) else ( queue_item, ) ):
+                        processed = self._normalize_queue_item( item )
 
-    async def _shutdown( self ) -> None:
-        """ Gather and cancel all tasks and stop the async loop """
+                        if processed:
+                            self._pending.append( processed )
 
-        tasks: list[ asyncio.Task ] = [ t for t in asyncio.all_tasks( self.loop ) if t is not asyncio.current_task() ]
+            if self._pending:
+                self._flush_pending()
 
-        for task in tasks:
-            task.cancel()
+        except Exception as e:
+            logging.error( f'Error in output poll: { e }' )
 
-        await asyncio.gather( *tasks, return_exceptions = True )
-        self.loop.stop()
+        finally:
+            if self._running:
+                self._poll_id = self.text_widget.after( POLL_INTERVAL_MS, self._poll )
 
 
     def closedown( self ) -> None:
-        """ Close asyncio """
+        """ Stop polling the output queue """
 
         self._running = False
 
-        if self.loop and self.loop.is_running():
-            self._loop_thread.join( timeout = 3 )
-
-            try:
-                self.loop.call_soon_threadsafe( self.loop.stop )
-
-            except:
-                raise
+        if self._poll_id is not None:
+            self.text_widget.after_cancel( self._poll_id )
+            self._poll_id = None
 
 
     def start( self ) -> None:
-        """ Start thread to parse queue """
+        """ Start polling the output queue """
 
         if not self._running:
             self._running = True
-            self._loop_thread = threading.Thread( target = self._run_async_loop, daemon = True )
-            self._loop_thread.start()
+            self._poll()
@@ -109,27 +109,23 @@ def set_ui_style( style: Style ) -> None:
                     font = ( 'Calibri', 12, 'italic' ),
                     foreground = "#0054BB"
     )
-    style.configure( 'AppTestHover.TLabel',
-                    background = '#c2e6f3',
-                    font = ( 'Calibri', 12, 'italic' ),
-                    foreground = "#0054BB"
-    )
-    style.configure( 'ScriptHover.TLabel',
-                    background = '#c2e6f3',
-                    font = ( 'Calibri', 12, 'normal' )
+    style.map( 'AppTestNormal.TLabel',
+                background = [ ( 'active', '#c2e6f3' ) ]
     )
     style.configure( 'ScriptNormal.TLabel',
                     background = 'SystemButtonFace',
                     font = ( 'Calibri', 12, 'normal' )
     )
-    style.configure( 'DevHover.TLabel',
-                    background = '#c2e6f3',
-                    font = ( 'Calibri', 12, 'bold' )
+    style.map( 'ScriptNormal.TLabel',
+                background = [ ( 'active', '#c2e6f3' ) ]
     )
     style.configure( 'DevNormal.TLabel',
                     background = 'SystemButtonFace',
                     font = ( 'Calibri', 12, 'bold' )
     )
+    style.map( 'DevNormal.TLabel',
+                background = [ ( 'active', '#c2e6f3' ) ]
+    )
     style.configure( 'History.TLabel',
                     font = ( 'Calibri', 12, 'bold' )
     )
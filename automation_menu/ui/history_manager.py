@@ -132,7 +132,7 @@ class HistoryManager:
         tree_id: str = self.history_tree.insert( parent = '',
                                  index = 0,
                                  text = f'{ item.start.strftime( '%m / %d : %H:%M:%S' ) }',
-                                 values = ( item.script_info.get_attr( 'filename' ) )
+                                 values = ( item.script_info.filename )
                                 )
 
         self._historylist.append( { 'id': tree_id, 'item': item } )
@@ -16,6 +16,7 @@ from automation_menu.models.geometry import Geometry
 if TYPE_CHECKING:
     from automation_menu.core.app_context import ApplicationContext
     from automation_menu.models.application_state import ApplicationState
+    from pathlib import Path
 
 import dynamicinputbox
 
@@ -23,7 +24,6 @@ from tkinter import E, N, S, W, Event, Tk, Widget, messagebox
 from tkinter.ttk import Button, Combobox, Frame, Notebook, Style
 from typing import Tuple
 
-from automation_menu.filehandling.settings_handler import write_settingsfile
 from automation_menu.models.enums import ApplicationRunState, OutputStyleTags, SysInstructions
 from automation_menu.ui.async_output_controller import AsyncOutputController
 from automation_menu.ui.config_ui_style import set_output_styles, set_ui_style
@@ -49,7 +49,7 @@ class AutomationMenuWindow:
         self.app_state: ApplicationState = app_state
         self.app_context: ApplicationContext = app_context
         self.app_context.main_window = self
-        self.settings_file_path: str = self.app_state.secrets.get( 'settings_file_path' )
+        self.settings_file_path: Path = self.app_state.secrets.get( 'settings_file_path' )
 
         self.old_window_geometry: Geometry = Geometry()
         self.widgets = {}
@@ -87,6 +87,7 @@ class AutomationMenuWindow:
 
         # Create main GUI
         self.root: Tk = Tk()
+        self.app_state.settings.bind_scheduler( self.root )
         title_string: str = self.app_state.secrets.get( 'mainwindowtitle' )
 
         if self.app_context.startup_arguments[ 'app_run_state' ] == ApplicationRunState.DEV:
@@ -270,8 +271,8 @@ class AutomationMenuWindow:
             new_lang (str): The new language to change to
         """
 
-        self.app_state.settings.current_language = new_lang
-        write_settingsfile( settings = self.app_state.settings, settings_file_path = self.settings_file_path )
+        self.app_state.settings.set( 'current_language', new_lang )
+        self.app_state.settings.flush()
 
 
     @ui_guard_method( when_message = 'Pausing/resuming execution' )
@@ -336,7 +337,7 @@ class AutomationMenuWindow:
         self.disable_pause_script_button()
         self.disable_stop_script_button()
 
-        if self.app_state.settings.get( 'minimize_on_running' ) and not disable_minimize:
+        if self.app_state.settings.minimize_on_running and not disable_minimize:
             self.min_max_on_running()
 
         self._minimize_show_controls()
@@ -360,7 +361,7 @@ class AutomationMenuWindow:
         self.app_context.output_queue.put( SysInstructions.CLEAROUTPUT )
         self.app_context.input_manager.hide_input_frame()
 
-        if self.app_state.settings.get( 'minimize_on_running' ):
+        if self.app_state.settings.minimize_on_running:
             if disable_minimize:
                 self.app_context.output_queue.put( {
                     'line': _( 'The script has \'DisableMinimizeOnRunning\', meaning the window will not be minimized.' ),
@@ -389,7 +390,7 @@ class AutomationMenuWindow:
                 return
 
         try:
-            write_settingsfile( settings = self.app_state.settings, settings_file_path = self.app_state.secrets.get( 'settings_file_path' ) )
+            self.app_state.settings.flush()
 
         except Exception as e:
 
@@ -416,7 +417,7 @@ class AutomationMenuWindow:
 
             return
 
-        self.app_state.settings.current_language = event.widget.get()
+        self.app_state.settings.set( 'current_language', event.widget.get() )
         self.app_context.language_manager.change_app_language( new_language = event.widget.get() )
 
 
@@ -427,7 +428,7 @@ class AutomationMenuWindow:
             new_value (bool): New value to save
         """
 
-        self.app_state.settings.force_focus_post_execution = new_value
+        self.app_state.settings.set( 'force_focus_post_execution', new_value )
 
         if new_value:
             self.settings_ui[ 'chb_force_focus_post_execution' ].config( state = 'normal' )
@@ -452,7 +453,7 @@ class AutomationMenuWindow:
             new_value (bool): New value to save
         """
 
-        self.app_state.settings.send_mail_on_error = new_value
+        self.app_state.settings.set( 'send_mail_on_error', new_value )
 
         if new_value:
             self.settings_ui[ 'chbIncludeSsInErrorMail' ].config( state = 'normal' )
@@ -468,7 +469,7 @@ class AutomationMenuWindow:
             new_value (bool): New value to save
         """
 
-        self.app_state.settings.include_ss_in_error_mail = new_value
+        self.app_state.settings.set( 'include_ss_in_error_mail', new_value )
 
 
     def set_minimize_on_running( self, new_value: bool ) -> None:
@@ -478,7 +479,7 @@ class AutomationMenuWindow:
             new_value (bool): New value to save
         """
 
-        self.app_state.settings.minimize_on_running = new_value
+        self.app_state.settings.set( 'minimize_on_running', new_value )
 
 
     @ui_guard_method( when_message = 'Down-/resizing window before/after script execution' )
@@ -512,7 +513,7 @@ class AutomationMenuWindow:
             new_value (bool): New value to set and save
         """
 
-        self.app_state.settings.on_top = new_value
+        self.app_state.settings.set( 'on_top', new_value )
         self.root.focus_force()
         self.root.attributes( '-topmost', new_value )
 
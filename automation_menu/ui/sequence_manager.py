@@ -443,7 +443,7 @@ class SequenceManager:
         self._current_step_for_edit.script_file = selected_script.fullpath
         self._current_step_for_edit.script_info = selected_script
 
-        if len( selected_script.scriptmeta.script_input_parameters ) > 0:
+        if selected_script.scriptmeta.has_input_parameters():
             self._show_step_form_input( input = selected_script.scriptmeta.script_input_parameters )
 
 
@@ -460,7 +460,7 @@ class SequenceManager:
 
             sequences_list.append( jsoned_sequence )
 
-        self._app_state.settings.saved_sequences = sequences_list
+        self._app_state.settings.set( 'saved_sequences', sequences_list )
 
 
     def _populate_sequence_form( self, sequence: Sequence ) -> None:
@@ -528,6 +528,8 @@ class SequenceManager:
         for step in [ ( i, s ) for i, s in enumerate( self._current_sequence.steps ) ]:
             step[ 1 ].step_index = step[ 0 ]
 
+        self._current_sequence.mark_dirty()
+
 
     def _list_sequences( self ) -> None:
         """ List available sequences """
@@ -573,6 +575,7 @@ class SequenceManager:
                 )
                 self._current_step_for_edit.pre_set_parameters = step_input
 
+        self._current_sequence.mark_dirty()
         self.hide_step_form()
         self._populate_sequence_steps( sequence = self._current_sequence )
         self._persist_sequences()
@@ -603,7 +606,6 @@ class SequenceManager:
                                     run_input = run_args
                     )
 
-                    runner.current_process.wait()
                     exit_code: int = runner._exec_item.exit_code
                     terminated: bool = runner._terminated
 
@@ -680,7 +682,7 @@ class SequenceManager:
             self._sequence_widgets[ 'step_script_field' ].set( self._current_step_for_edit.script_info.filename )
             self._sequence_widgets[ 'stop_step_on_error_var' ].set( self._current_step_for_edit.stop_on_error )
 
-            if len( self._current_step_for_edit.script_info.scriptmeta.script_input_parameters ) > 0:
+            if self._current_step_for_edit.script_info.scriptmeta.has_input_parameters():
                 self._show_step_form_input( input = self._current_step_for_edit.script_info.scriptmeta.script_input_parameters, pre_set = self._current_step_for_edit.pre_set_parameters )
 
             else:
@@ -915,6 +917,7 @@ class SequenceManager:
 
         self._current_sequence.name = self._sequence_widgets[ 'name_field' ].get()
         self._current_sequence.description = self._sequence_widgets[ 'description_field' ].get()
+        self._current_sequence.mark_dirty()
 
         self._sequences[ self._current_sequence.id ] = self._current_sequence
         self._persist_sequences()
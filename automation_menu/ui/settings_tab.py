@@ -55,7 +55,7 @@ def _list_settings( tab: Frame, settings: Settings, main_self: AutomationMenuWin
     chb_on_top_title.grid( column = 0, row = row, sticky = ( W, E ) )
     main_self.app_context.language_manager.add_translatable_widget( ( chb_on_top_title, 'Set as topmost window' ) )
 
-    val_chb_on_top: BooleanVar = BooleanVar( value = settings.get( 'on_top' ) )
+    val_chb_on_top: BooleanVar = BooleanVar( value = settings.on_top )
     chb_on_top: Checkbutton = Checkbutton( master = app_settings_group,
                              variable = val_chb_on_top,
                              command = lambda: main_self.set_on_top( val_chb_on_top.get() ) )
@@ -72,7 +72,7 @@ def _list_settings( tab: Frame, settings: Settings, main_self: AutomationMenuWin
     chb_force_focus_post_execution_title.grid( column = 0, row = row, sticky = ( W, E ) )
     main_self.app_context.language_manager.add_translatable_widget( ( chb_force_focus_post_execution_title, 'Minimize size during script execution' ) )
 
-    val_chb_force_focus_post_execution: BooleanVar = BooleanVar( value = settings.get( 'minimize_on_running' ) )
+    val_chb_force_focus_post_execution: BooleanVar = BooleanVar( value = settings.minimize_on_running )
     chb_force_focus_post_execution: Checkbutton = Checkbutton( master = app_settings_group,
                                           variable = val_chb_force_focus_post_execution,
                                           command = lambda: main_self.set_minimize_on_running( val_chb_force_focus_post_execution.get() ) )
@@ -89,7 +89,7 @@ def _list_settings( tab: Frame, settings: Settings, main_self: AutomationMenuWin
     chb_force_focus_post_execution_title.grid( column = 0, row = row, sticky = ( W, E ) )
     main_self.app_context.language_manager.add_translatable_widget( ( chb_force_focus_post_execution_title, 'Main window focus post execution' ) )
 
-    val_chb_force_focus_post_execution: BooleanVar = BooleanVar( value = settings.get( 'force_focus_post_execution' ) )
+    val_chb_force_focus_post_execution: BooleanVar = BooleanVar( value = settings.force_focus_post_execution )
     chb_force_focus_post_execution: Checkbutton = Checkbutton( master = app_settings_group,
                                           variable = val_chb_force_focus_post_execution,
                                           command = lambda: main_self.set_force_focus_post_execution( val_chb_force_focus_post_execution.get() ) )
@@ -106,7 +106,7 @@ def _list_settings( tab: Frame, settings: Settings, main_self: AutomationMenuWin
     cmb_current_language_title.grid( column = 0, row = row, sticky = ( N, W ) )
     main_self.app_context.language_manager.add_translatable_widget( ( cmb_current_language_title, 'Application language' ) )
 
-    val_cmb_current_language: StringVar = StringVar( value = settings.get( 'current_language' ) )
+    val_cmb_current_language: StringVar = StringVar( value = settings.current_language )
     cmb_current_language: Combobox = Combobox( master = app_settings_group,
                                        values = get_available_languages(),
                                        textvariable = val_cmb_current_language.get )
@@ -137,7 +137,7 @@ def _list_settings( tab: Frame, settings: Settings, main_self: AutomationMenuWin
     keepass_shortcut_value_frame: Frame = Frame( master = app_settings_group )
     keepass_shortcut_value_frame.grid( column = 1, row = row, sticky = ( N, W, E ) )
 
-    val_keepass_shortcut_ctrl: BooleanVar = BooleanVar( value = main_self.app_state.settings.get( 'keepass_shortcut' ).get( 'ctrl' ) )
+    val_keepass_shortcut_ctrl: BooleanVar = BooleanVar( value = main_self.app_state.settings.keepass_shortcut.get( 'ctrl' ) )
     keepass_shortcut_ctrl: Checkbutton = Checkbutton( master = keepass_shortcut_value_frame,
                                         text = _( 'CTRL' ),
                                         variable = val_keepass_shortcut_ctrl,
@@ -148,7 +148,7 @@ def _list_settings( tab: Frame, settings: Settings, main_self: AutomationMenuWin
     main_self.app_context.language_manager.add_translatable_widget( ( keepass_shortcut_ctrl, 'CTRL' ) )
     keepass_shortcut_ctrl.update_idletasks()
 
-    val_keepass_shortcut_alt: BooleanVar = BooleanVar( value = main_self.app_state.settings.get( 'keepass_shortcut' ).get( 'alt' ) )
+    val_keepass_shortcut_alt: BooleanVar = BooleanVar( value = main_self.app_state.settings.keepass_shortcut.get( 'alt' ) )
     keepass_shortcut_alt: Checkbutton = Checkbutton( master = keepass_shortcut_value_frame,
                                        text = _( 'ALT' ),
                                        variable = val_keepass_shortcut_alt,
@@ -159,7 +159,7 @@ def _list_settings( tab: Frame, settings: Settings, main_self: AutomationMenuWin
     main_self.app_context.language_manager.add_translatable_widget( ( keepass_shortcut_alt, 'ALT' ) )
     keepass_shortcut_alt.update_idletasks()
 
-    val_keepass_shortcut_shift: BooleanVar = BooleanVar( value = main_self.app_state.settings.get( 'keepass_shortcut' ).get( 'shift' ) )
+    val_keepass_shortcut_shift: BooleanVar = BooleanVar( value = main_self.app_state.settings.keepass_shortcut.get( 'shift' ) )
     keepass_shortcut_shift: Checkbutton = Checkbutton( master = keepass_shortcut_value_frame,
                                          text = _( 'Shift' ),
                                          variable = val_keepass_shortcut_shift,
@@ -170,7 +170,7 @@ def _list_settings( tab: Frame, settings: Settings, main_self: AutomationMenuWin
     main_self.app_context.language_manager.add_translatable_widget( ( keepass_shortcut_shift, 'Shift' ) )
     keepass_shortcut_shift.update_idletasks()
 
-    val_keepass_shortcut_key: StringVar = StringVar( value = main_self.app_state.settings.get( 'keepass_shortcut' ).get( 'key' ) )
+    val_keepass_shortcut_key: StringVar = StringVar( value = main_self.app_state.settings.keepass_shortcut.get( 'key' ) )
     keepass_shortcut_key: Entry = Entry( master = keepass_shortcut_value_frame,
                                  textvariable = val_keepass_shortcut_key )
     val_keepass_shortcut_key.trace_add( mode = 'write', callback = lambda *args: main_self.app_state.settings.set_keepass_shortcut( value_tup = ( 'key', val_keepass_shortcut_key.get() ) ) )
@@ -202,7 +202,7 @@ def _list_settings( tab: Frame, settings: Settings, main_self: AutomationMenuWin
     chb_send_mail_on_error_title.grid( column = 0, row = row, sticky = ( W, E ) )
     main_self.app_context.language_manager.add_translatable_widget( ( chb_send_mail_on_error_title, 'Send mail to developer on script error' ) )
 
-    val_chb_send_mail_on_error: BooleanVar = BooleanVar( value = main_self.app_state.settings.get( 'send_mail_on_error' ) )
+    val_chb_send_mail_on_error: BooleanVar = BooleanVar( value = main_self.app_state.settings.send_mail_on_error )
     chb_send_mail_on_error: Checkbutton = Checkbutton( master = error_group,
                                           variable = val_chb_send_mail_on_error,
                                           command = lambda: main_self.set_send_mail_on_error( val_chb_send_mail_on_error.get() ) )
@@ -219,7 +219,7 @@ def _list_settings( tab: Frame, settings: Settings, main_self: AutomationMenuWin
     chb_include_screenshot_in_errormail_title.grid( column = 0, row = row, sticky = ( W, E ) )
     main_self.app_context.language_manager.add_translatable_widget( ( chb_include_screenshot_in_errormail_title, 'Include screenshot in mail when reporting error', False, False ) )
 
-    val_chb_include_ss_in_error_mail: BooleanVar = BooleanVar( value = main_self.app_state.settings.get( 'include_ss_in_error_mail' ) )
+    val_chb_include_ss_in_error_mail: BooleanVar = BooleanVar( value = main_self.app_state.settings.include_ss_in_error_mail )
     chb_include_screenshot_in_errormail: Checkbutton = Checkbutton( master = error_group,
                                                       variable = val_chb_include_ss_in_error_mail,
                                                       command = lambda: main_self.set_include_ss_in_error_mail( val_chb_include_ss_in_error_mail.get() ) )
@@ -171,11 +171,12 @@ def docstring_parser( raw_docstring: str ) -> tuple[ dict, dict ]:
     return parsed_data, warnings
 
 
-def extract_script_metadata( script_info: ScriptInfo ) -> tuple[ dict, dict ]:
+def extract_script_metadata( script_info: ScriptInfo, text: str | None = None ) -> tuple[ dict, dict ]:
     """ Extract the docstring for script
 
     Args:
         script_info (ScriptInfo): ScriptInfo object for found script file
+        text (str | None): Already read file content, the file is read if not given
 
     Returns:
         parsed_data (dict): Description and fields, including script input parameters,
@@ -185,8 +186,11 @@ def extract_script_metadata( script_info: ScriptInfo ) -> tuple[ dict, dict ]:
     """
 
     try:
-        with open( script_info.get_attr( 'fullpath' ), 'r', encoding = 'utf-8' ) as f:
-            tree: ast.Module = ast.parse( f.read() )
+        if text is None:
+            with open( script_info.fullpath, 'r', encoding = 'utf-8' ) as f:
+                text = f.read()
+
+        tree: ast.Module = ast.parse( text )
 
         if ( tree.body
             and isinstance( tree.body[ 0 ], ast.Expr )
@@ -200,4 +204,4 @@ def extract_script_metadata( script_info: ScriptInfo ) -> tuple[ dict, dict ]:
     except SyntaxError as e:
         from automation_menu.utils.localization import _
 
-        raise ValueError( _( f'Cannot parse {f}:\n{e}' ) ).format( f = script_info.get_attr( 'fullpath' ), e = e )
+        raise ValueError( _( f'Cannot parse {f}:\n{e}' ) ).format( f = script_info.fullpath, e = e )
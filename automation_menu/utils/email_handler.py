@@ -60,7 +60,7 @@ def _compose( script_info: ScriptInfo, error_msg: str, screenshot: str, app_stat
         img_included = '&nbsp;'
 
     header: str = _( 'Script error' )
-    text1: str = _( 'Error occured when your script ''<strong>{script_name}</strong>'' was running' ).format( script_name = script_info.get_attr( 'filename' ) )
+    text1: str = _( 'Error occured when your script ''<strong>{script_name}</strong>'' was running' ).format( script_name = script_info.filename )
     text2: str = _( 'The error occured at: {time}' ).format( time = datetime.now().strftime( '%Y-%m-%d %H:%M:%S' ) )
     error_title: str = _( '<strong>Error message</strong>' )
     sign: str = _( 'This is an automatic message sent from AutomationMenu' )
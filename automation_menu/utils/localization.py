@@ -16,6 +16,24 @@ from pathlib import Path, WindowsPath
 from typing import Callable
 
 
+# Translation function of the currently loaded language
+_translate: Callable[ [ str ], str ] = lambda message: message
+
+
+def _( message: str ) -> str:
+    """ Translate a message with the currently loaded language
+    The translation is looked up on each call, so module level imports of this function follow language changes
+
+    Args:
+        message (str): Message to translate
+
+    Returns:
+        (str): Translated message
+    """
+
+    return _translate( message )
+
+
 def change_language( language_code: str ) -> None:
     """ Change the application language at runtime.
 
@@ -101,7 +119,7 @@ def setup_localization( domain: str = 'messages', language: str = None ) -> Call
         (Callable): Translation function to use as _()
     """
 
-    global _
+    global _translate
 
     # Determine which language to use
     if language is None:
@@ -120,13 +138,16 @@ def setup_localization( domain: str = 'messages', language: str = None ) -> Call
         )
 
         print( f'Loaded localization: { language } from { locale_dir }' )
-        _ = translation.gettext
+        _translate = translation.gettext
 
     except Exception as e:
         print( f'Warning: Could not load translation for { language } from { locale_dir }: { e }' )
         print( 'Falling back to English' )
 
-        # Return a function that just returns the original string
-        return lambda text: text
+        # Use a function that just returns the original string
+        _translate = lambda text: text
+
+    return _
+
 
-_: GNUTranslations = setup_localization()
+setup_localization()
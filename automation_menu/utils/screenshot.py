@@ -63,7 +63,7 @@ def take_screenshot( root_window: Tk, script_info: ScriptInfo, file_name_prefix:
     dataBitMap.CreateCompatibleBitmap( dcObj, root_window.winfo_width(), root_window.winfo_height() )
     cDC.SelectObject( dataBitMap )
     cDC.BitBlt( ( 0 , 0 ) , ( root_window.winfo_width() , root_window.winfo_height() ) , dcObj , ( 0 , 0 ), win32con.SRCCOPY )
-    bmp_tempfile: Path = os.path.join( tempfile.gettempdir(), f'{ file_name_prefix }_{ script_info.get_attr( 'filename' ) }_{ datetime.now().strftime( '%Y-%m-%d_%H.%M.%S' ) }.bmp' )
+    bmp_tempfile: Path = os.path.join( tempfile.gettempdir(), f'{ file_name_prefix }_{ script_info.filename }_{ datetime.now().strftime( '%Y-%m-%d_%H.%M.%S' ) }.bmp' )
     dataBitMap.SaveBitmapFile( cDC , bmp_tempfile )
 
     png_path: str = _convert_bmp_to_png( bmp_path = bmp_tempfile, delete_bmp = True )
@@ -32,6 +32,8 @@ class ScriptManager:
         self._app_state: ApplicationState = app_state
 
         self._script_list: list[ ScriptInfo ] = None
+        self._scripts_by_filename: dict[ str, ScriptInfo ] = {}
+        self._scripts_by_path: dict[ str, ScriptInfo ] = {}
 
         self.gather_scripts()
 
@@ -41,6 +43,10 @@ class ScriptManager:
 
         self._script_list = get_scripts( output_queue = self._app_context.output_queue, app_state = self._app_state, app_run_state = self._app_context.startup_arguments[ 'app_run_state' ] )
 
+        # Index the listing for lookups, reversed so the first script of a duplicate name is kept
+        self._scripts_by_filename = { si.filename: si for si in reversed( self._script_list ) }
+        self._scripts_by_path = { si.fullpath: si for si in reversed( self._script_list ) }
+
 
     def get_script_info_by_filename( self, filename: str ) -> ScriptInfo:
         """ Retrieve ScriptInfo for script at path
@@ -52,12 +58,7 @@ class ScriptManager:
             (ScriptInfo): Found ScriptInfo, or None
         """
 
-        for si in self._script_list:
-            if si.filename == filename:
-
-                return si
-
-        return None
+        return self._scripts_by_filename.get( filename )
 
 
     def get_script_info_by_path( self, path: str ) -> ScriptInfo:
@@ -70,12 +71,7 @@ class ScriptManager:
             (ScriptInfo): Found ScriptInfo, or None
         """
 
-        for si in self._script_list:
-            if si.fullpath == path:
-
-                return si
-
-        return None
+        return self._scripts_by_path.get( path )
 
 
     def get_script_list( self ) -> list[ ScriptInfo ]:
@@ -19,19 +19,22 @@ from automation_menu.models.enums import ScriptState, ValidScriptInfoFields
 from automation_menu.models.scriptinfo import ScriptInfo
 
 
-def scriptinfo_block_parser( script_info: ScriptInfo ) -> tuple[ dict, dict ]:
+def scriptinfo_block_parser( script_info: ScriptInfo, text: str | None = None ) -> tuple[ dict, dict ]:
     """ Parse the file content and extract script information
 
     Args:
         script_info (ScriptInfo): Script info gathered from the scripts info block
+        text (str | None): Already read file content, the file is read if not given
 
     Returns:
         (tuple[ scriptinfo_meta, warnings ]): Script information from the script info block and list of invalid keys and values
     """
 
+    if text is None:
+        with open( script_info.fullpath, 'r', encoding = 'utf-8' ) as f:
+            text = f.read()
 
-    with open( script_info.get_attr( 'fullpath' ), 'r', encoding = 'utf-8' ) as f:
-        full_text: str = f.read()
+    full_text: str = text
 
     match: Match = re.search( r'ScriptInfo\s*(.*?)\s*ScriptInfoEnd', full_text, re.DOTALL )
 
@@ -27,7 +27,7 @@ from logging import Formatter, Logger, StreamHandler
 
 from automation_menu.core.app_context import ApplicationContext
 from automation_menu.core.script_execution_manager import ScriptExecutionManager
-from automation_menu.filehandling.exec_history_handler import write_exec_history
+from automation_menu.filehandling.exec_history_handler import ExecHistoryWriter
 from automation_menu.filehandling.secrets_handler import read_secrets_file
 from automation_menu.filehandling.settings_handler import read_settingsfile, write_settingsfile
 from automation_menu.models import Secrets, Settings, User
@@ -96,7 +96,7 @@ def main() -> None:
 
         app_context.debug_logger = setup_logger( level = app_context.startup_arguments[ 'loglevel' ] )
 
-        app_state.secrets = Secrets( read_secrets_file( file_path = Path( __file__ ).resolve().parent / 'secrets.json' ) )
+        app_state.secrets = Secrets.from_dict( read_secrets_file( file_path = Path( __file__ ).resolve().parent / 'secrets.json' ) )
         read_settings: dict = read_settingsfile( settings_file_path = app_state.secrets.get( 'settings_file_path' ), debug_logger = app_context.debug_logger )
         app_state.settings = Settings( settings_dict = read_settings, save_callback = save_settings )
         app_context.debug_logger.debug( msg = f'sequence list loaded with "{ len( app_state.settings.saved_sequences ) }" sequences' )
@@ -112,16 +112,15 @@ def main() -> None:
         app_context.execution_manager = ScriptExecutionManager( output_queue = app_context.output_queue, app_state = app_state )
         app_context.sequence_manager = SequenceManager( app_context = app_context, app_state = app_state, saved_sequences = app_state.settings.saved_sequences )
         app_context.history_manager = HistoryManager( logger = app_context.debug_logger )
+        app_context.exec_history_writer = ExecHistoryWriter( root_dir = Path( __file__ ).resolve().parent, logger = app_context.debug_logger )
 
         # Launch the main application window
         from automation_menu.ui.main_window import AutomationMenuWindow
         from automation_menu.utils.localization import _
         AutomationMenuWindow( app_state = app_state, app_context = app_context )
 
-        write_exec_history(
-            exec_items = app_context.history_manager.get_history_list(),
-            root_dir = Path( __file__ ).resolve().parent
-        )
+        app_context.exec_history_writer.write( exec_items = app_context.history_manager.get_history_list() )
+        app_context.exec_history_writer.close()
 
     except KeyboardInterrupt:
         print( _( 'Application interrupted by user' ) )